@@ -0,0 +1,364 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+@author: Federico Mollica
+
+Resumable batch conversions for XLSX_CSV_DOC_PDF_Converter_FM.py.
+
+Every file of the batch has an entry in a job manifest, a JSON-lines file
+next to the files (one line per state change, the last line of a file wins):
+  {"input": "/abs/scan.pdf", "state": "done", "output": "/abs/scan.docx",
+   "sha256": "...", "seconds": 4.2, "attempts": 1, "error": null, ...}
+States: pending -> running -> done | failed. Each line is flushed to disk
+before the work it announces goes on, so when a run dies (crash, reboot,
+Ctrl+C) a rerun with the same manifest resumes where it stopped:
+- done files are skipped while their output still has the recorded checksum
+  and the input has not changed since;
+- pending and interrupted (running) files are converted;
+- failed files are retried up to --max-attempts attempts in total, waiting
+  --backoff seconds before the first retry and twice as long before each next one;
+- invalid requests (a table already in the target format, a file that is not a
+  readable document or table) fail at once and stay failed on later runs.
+--retry-failed starts every failed file over.
+Outputs are written to a temporary file and moved into place when complete,
+so an interrupted conversion never leaves a truncated file behind.
+
+Usage:
+$ python Batch_Converter_FM.py run scans/ --workers 4
+$ python Batch_Converter_FM.py run sales/*.csv --target .parquet --manifest sales.jsonl
+$ python Batch_Converter_FM.py run sales/ --target .parquet --dtype account=string --dtype amount=float64
+$ python Batch_Converter_FM.py status --manifest scans/conversion_manifest.jsonl
+"""
+
+import argparse
+import glob
+import hashlib
+import heapq
+import json
+import multiprocessing
+import os
+import sys
+import time
+import zipfile
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from datetime import datetime
+
+import XLSX_CSV_DOC_PDF_Converter_FM as converter
+
+# --------------------------------- Settings -----------------------------------
+MANIFEST_NAME = "conversion_manifest.jsonl"  # Default manifest, in the folder of the first input
+MAX_ATTEMPTS = 3        # Attempts per file before it is left as failed
+RETRY_BACKOFF = 5.0     # Seconds before the first retry, doubled for each next one
+# Errors that another attempt cannot fix (unsupported request, unreadable document,
+# unparsable table, .xlsx that is not a zip): no retry
+PERMANENT_ERRORS = (ValueError, zipfile.BadZipFile)
+SUPPORTED = converter.TABLE_FORMATS + (".pdf", ".docx", ".doc")
+STATES = ("pending", "running", "done", "failed")
+
+
+def now():
+    return datetime.now().isoformat(timespec="seconds")
+
+
+def file_sha256(path):
+    """SHA-256 of a file, read in 1 MiB blocks."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def input_signature(path):
+    """[size, mtime in ns]: tells whether an input changed since it was converted."""
+    stat = os.stat(path)
+    return [stat.st_size, stat.st_mtime_ns]
+
+
+# --------------------------------- Manifest -----------------------------------
+
+class Manifest:
+    """
+    Checkpoint of a batch run, stored as JSON lines: each update appends the
+    whole entry of one file, and on load the last line of every file wins.
+    Loading compacts the file to one line per file (written to a temporary
+    file, then moved into place), so it does not grow from run to run.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.entries = {}
+        if os.path.exists(path):
+            with open(path, encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        continue  # Line cut short by a crash while it was written
+                    self.entries[entry.pop("input")] = entry
+            with converter.atomic_output(path) as temp_path:
+                with open(temp_path, "w", encoding="utf-8") as f:
+                    for input_path, entry in self.entries.items():
+                        f.write(json.dumps({"input": input_path, **entry}) + "\n")
+        self._file = open(path, "a", encoding="utf-8")
+
+    def update(self, input_path, **fields):
+        """Change the entry of input_path and append it to the manifest, synced to disk."""
+        entry = self.entries.setdefault(input_path, {
+            "state": "pending", "output": None, "target": None, "sha256": None, "seconds": None,
+            "attempts": 0, "error": None, "permanent": False, "input_signature": None, "started": None,
+            "finished": None, "outputs": [],
+        })
+        entry.update(fields)
+        self._file.write(json.dumps({"input": input_path, **entry}) + "\n")
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        return entry
+
+    def outputs(self):
+        """Every file the batch has written, including outputs of earlier targets."""
+        return {output for entry in self.entries.values() for output in entry.get("outputs", [])}
+
+    def close(self):
+        self._file.close()
+
+
+# ------------------------------ Worker Processes ------------------------------
+
+def convert_one(input_path, target, dtype=None):
+    """Convert one file inside a worker process and return the fields of its done entry."""
+    start = time.perf_counter()
+    output = converter.convert_file(input_path, target, dtype=dtype)
+    return {"output": output, "sha256": file_sha256(output),
+            "seconds": round(time.perf_counter() - start, 6)}
+
+
+# ------------------------------- Batch Runner ---------------------------------
+
+def collect_inputs(paths):
+    """Absolute paths of the files to convert; folders give their supported files (not recursive)."""
+    inputs = []
+    for path in paths:
+        if os.path.isdir(path):
+            for entry in sorted(os.scandir(path), key=lambda entry: entry.name):
+                if entry.is_file() and entry.name.lower().endswith(SUPPORTED) and ".partial-" not in entry.name:
+                    inputs.append(os.path.abspath(entry.path))
+        else:
+            inputs.append(os.path.abspath(path))
+    return list(dict.fromkeys(inputs))
+
+
+def plan(manifest, inputs, target, max_attempts, retry_failed):
+    """
+    Decide what to do with every input: returns the files to convert, in order,
+    and updates the manifest for the files that are skipped or reset.
+    """
+    input_set = set(inputs)
+    planned_outputs = {}  # Output path -> the input that will write it
+    todo = []
+    for path in inputs:
+        if not os.path.isfile(path) or not path.lower().endswith(SUPPORTED):
+            manifest.update(path, state="failed", error="Not a supported file", finished=now())
+            continue
+        job_target = target if path.lower().endswith(converter.TABLE_FORMATS) else None
+        output = converter.output_path_for(path, job_target)
+        if output != path and output in input_set:
+            manifest.update(path, state="failed", finished=now(),
+                            error=f"Output would overwrite another input: {output}")
+            continue
+        if output in planned_outputs:
+            manifest.update(path, state="failed", finished=now(),
+                            error=f"Output would overwrite the output of {planned_outputs[output]}")
+            continue
+        planned_outputs[output] = path
+        entry = manifest.entries.get(path)
+        if entry is None or entry["target"] != job_target:
+            manifest.update(path, state="pending", target=job_target, attempts=0, error=None, permanent=False)
+        elif entry["state"] == "done":
+            unchanged = (entry["input_signature"] == input_signature(path)
+                         and entry["output"] and os.path.isfile(entry["output"])
+                         and file_sha256(entry["output"]) == entry["sha256"])
+            if unchanged:
+                continue
+            manifest.update(path, state="pending", attempts=0, error=None, permanent=False)
+        elif retry_failed and entry["state"] == "failed":
+            manifest.update(path, state="pending", attempts=0, error=None, permanent=False)
+        elif entry["state"] == "failed" and entry.get("permanent"):
+            continue  # Another attempt cannot fix it; --retry-failed starts it over
+        elif entry["attempts"] >= max_attempts:
+            if entry["state"] == "running":
+                # Every attempt was cut short: the file may be what brings the whole run down
+                manifest.update(path, state="failed", finished=now(),
+                                error=entry["error"] or f"Interrupted {entry['attempts']} times")
+            continue  # Out of attempts; --retry-failed starts it over
+        else:
+            # Failed with attempts left, or interrupted (running) when the previous run died
+            manifest.update(path, state="pending")
+        # Temporary output of a run that was killed before it could clean up
+        base, ext = os.path.splitext(output)
+        for leftover in glob.glob(f"{glob.escape(base)}.partial-*{glob.escape(ext)}"):
+            os.remove(leftover)
+        todo.append(path)
+    return todo
+
+
+def run_batch(paths, manifest_path=None, target=None, workers=None, max_attempts=MAX_ATTEMPTS,
+              backoff=RETRY_BACKOFF, retry_failed=False, dtype=None, report=print):
+    """
+    Convert the files and folders in paths, checkpointing every state change in the manifest.
+    dtype ({column: dtype}) are the CSV type hints passed to every table conversion.
+    Returns the number of files per state over the whole manifest.
+    """
+    inputs = collect_inputs(paths)
+    if manifest_path is None:
+        first = inputs[0] if inputs else os.path.join(os.getcwd(), "x")
+        manifest_path = os.path.join(os.path.dirname(first), MANIFEST_NAME)
+    manifest = Manifest(os.path.abspath(manifest_path))
+    try:
+        # Outputs of earlier runs are not inputs (a folder of converted PDFs also
+        # holds their DOCX files, which must not be converted back over the PDFs)
+        outputs = manifest.outputs()
+        sources = [path for path in inputs if path not in outputs]
+        todo = plan(manifest, sources, target, max_attempts, retry_failed)
+        report(f"{len(sources)} files ({len(inputs) - len(sources)} outputs of earlier runs left out), "
+               f"{len(todo)} to convert, manifest {manifest.path}")
+        if todo:
+            _convert_all(manifest, todo, workers, max_attempts, backoff, dtype, report)
+        counts = {state: 0 for state in STATES}
+        for entry in manifest.entries.values():
+            counts[entry["state"]] += 1
+        return counts
+    finally:
+        manifest.close()
+
+
+def _convert_all(manifest, todo, workers, max_attempts, backoff, dtype, report):
+    """Run the conversions in a process pool, keeping at most `workers` files in flight."""
+    workers = workers or os.cpu_count() or 1
+    # "spawn" so the workers start from a clean interpreter, as in the GUI
+    context = multiprocessing.get_context("spawn")
+    pool = ProcessPoolExecutor(max_workers=workers, mp_context=context)
+    queue = list(reversed(todo))  # Next file at the end
+    retries = []                  # Heap of (time the retry is due, file)
+    running = {}                  # future -> file
+
+    def renew_pool():
+        """
+        A worker died (e.g. a crash in a native library) and took the pool down:
+        the other jobs of the pool fail too and are retried in a new pool.
+        """
+        nonlocal pool
+        for future in wait(running)[0]:
+            finish(future)
+        pool.shutdown(wait=False)
+        pool = ProcessPoolExecutor(max_workers=workers, mp_context=context)
+
+    def start(path):
+        attempts = manifest.entries[path]["attempts"] + 1
+        manifest.update(path, state="running", attempts=attempts, started=now(),
+                        input_signature=input_signature(path))
+        try:
+            future = pool.submit(convert_one, path, manifest.entries[path]["target"], dtype)
+        except BrokenProcessPool:
+            renew_pool()
+            future = pool.submit(convert_one, path, manifest.entries[path]["target"], dtype)
+        running[future] = path
+
+    def finish(future):
+        """Record the outcome of a finished job; returns True when its worker pool broke."""
+        path = running.pop(future)
+        try:
+            result = future.result()
+        except Exception as e:
+            entry = manifest.entries[path]
+            permanent = isinstance(e, PERMANENT_ERRORS)
+            if entry["attempts"] < max_attempts and not permanent:
+                delay = backoff * 2 ** (entry["attempts"] - 1)
+                manifest.update(path, state="pending", error=str(e))
+                heapq.heappush(retries, (time.monotonic() + delay, path))
+                report(f"retry in {delay:g} s  {path}: {e}")
+            else:
+                manifest.update(path, state="failed", error=str(e), permanent=permanent, finished=now())
+                report(f"failed   {path}: {e}")
+            return isinstance(e, BrokenProcessPool)
+        outputs = sorted(set(manifest.entries[path]["outputs"]) | {result["output"]})
+        manifest.update(path, state="done", error=None, finished=now(), outputs=outputs, **result)
+        report(f"done     {path} -> {result['output']} ({result['seconds']:.2f} s)")
+        return False
+
+    try:
+        while queue or retries or running:
+            while retries and retries[0][0] <= time.monotonic():
+                queue.append(heapq.heappop(retries)[1])
+            while queue and len(running) < workers:
+                start(queue.pop())
+            if not running:
+                time.sleep(max(0, retries[0][0] - time.monotonic()))
+                continue
+            timeout = max(0, retries[0][0] - time.monotonic()) if retries else None
+            done, _ = wait(running, timeout=timeout, return_when=FIRST_COMPLETED)
+            if any([finish(future) for future in done]):
+                renew_pool()
+    finally:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+def print_status(manifest_path):
+    """Print the number of files per state and the errors of the failed ones."""
+    manifest = Manifest(os.path.abspath(manifest_path))
+    manifest.close()
+    counts = {state: 0 for state in STATES}
+    for entry in manifest.entries.values():
+        counts[entry["state"]] += 1
+    print(", ".join(f"{state} {count}" for state, count in counts.items()))
+    for input_path, entry in manifest.entries.items():
+        if entry["state"] == "failed":
+            print(f"failed ({entry['attempts']} attempts)  {input_path}: {entry['error']}")
+    return counts
+
+
+def parse_dtypes(items):
+    """{column: dtype} from the COLUMN=TYPE values of --dtype, None when there are none."""
+    dtype = {}
+    for item in items:
+        column, separator, type_name = item.rpartition("=")
+        if not separator or not column:
+            sys.exit(f"[ERROR: --dtype expects COLUMN=TYPE, got {item!r}]")
+        dtype[column] = type_name
+    return dtype or None
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[1])
+    commands = parser.add_subparsers(dest="command", required=True)
+    run_parser = commands.add_parser("run", help="convert files, resuming from the manifest")
+    run_parser.add_argument("paths", nargs="+", help="files and folders to convert")
+    run_parser.add_argument("--manifest", help=f"manifest file (default: {MANIFEST_NAME} next to the inputs)")
+    run_parser.add_argument("--target", choices=converter.TABLE_FORMATS, help="target format for tables")
+    run_parser.add_argument("--workers", type=int, default=None, help="worker processes (default: CPU count)")
+    run_parser.add_argument("--max-attempts", type=int, default=MAX_ATTEMPTS, help="attempts per file")
+    run_parser.add_argument("--backoff", type=float, default=RETRY_BACKOFF, help="seconds before the first retry")
+    run_parser.add_argument("--retry-failed", action="store_true", help="start failed files over")
+    run_parser.add_argument("--dtype", action="append", default=[], metavar="COLUMN=TYPE",
+                            help="pandas dtype of a CSV column, e.g. id=Int64 (repeatable)")
+    status_parser = commands.add_parser("status", help="summarize a manifest")
+    status_parser.add_argument("--manifest", required=True, help="manifest file")
+    args = parser.parse_args()
+
+    if args.command == "status":
+        if not os.path.exists(args.manifest):
+            sys.exit(f"[ERROR: No manifest at {args.manifest}]")
+        counts = print_status(args.manifest)
+    else:
+        try:
+            counts = run_batch(args.paths, args.manifest, args.target, args.workers,
+                               args.max_attempts, args.backoff, args.retry_failed, parse_dtypes(args.dtype))
+        except KeyboardInterrupt:
+            sys.exit("\nInterrupted: run the same command again to resume")
+        print(", ".join(f"{state} {count}" for state, count in counts.items()))
+    sys.exit(1 if counts["failed"] else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,345 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+@author: Federico Mollica
+
+Resident conversion server for XLSX_CSV_DOC_PDF_Converter_FM.py.
+
+A pool of worker processes imports the conversion backends (pandas, pyarrow,
+pdf2docx, python-docx, reportlab) once at start-up and then serves jobs sent
+over a local Unix socket. Every file then only pays for the conversion itself,
+not for starting Python and importing the libraries again.
+
+Protocol: one JSON object per line, in both directions.
+  request: {"job": "docx_doc_to_pdf", "input": "/abs/report.docx", "output": "/abs/report.pdf"}
+           {"job": "pdf_to_docx_with_images", "input": "/abs/scan.pdf"}
+           {"job": "convert_table", "input": "/abs/sales.csv", "target": ".parquet"}
+           {"job": "convert_table", "input": "/abs/ids.csv", "target": ".parquet", "dtype": {"id": "Int64"}}
+  replies: {"id": 1, "status": "queued", ...}
+           {"id": 1, "status": "running", "pid": 4242}
+           {"id": 1, "status": "done", "output": "...", "seconds": 0.012}
+           {"id": 1, "status": "failed", "error": "..."}
+"output" and "target" are optional and default to what the GUI would produce
+(an "output" for convert_table must have the target extension);
+"dtype" and "usecols" are the optional CSV parsing hints of convert_table().
+
+The socket is in $XDG_RUNTIME_DIR, or else in a folder of the temporary
+directory that only the current user may enter (mode 0700).
+
+Unix sockets are not available on Windows; there, use the GUI instead.
+
+Usage:
+$ python Converter_Server_FM.py serve --workers 4
+$ python Converter_Server_FM.py submit report.docx scan.pdf sales.csv --target .parquet
+"""
+
+import argparse
+import json
+import multiprocessing
+import os
+import queue
+import signal
+import socket
+import socketserver
+import stat
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+import XLSX_CSV_DOC_PDF_Converter_FM as converter
+
+# --------------------------------- Settings -----------------------------------
+JOBS = ("docx_doc_to_pdf", "pdf_to_docx_with_images", "convert_table")
+
+
+def default_socket():
+    """Socket path in a folder private to the current user (see secure_socket_dir)."""
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR")
+    if runtime_dir:
+        return os.path.join(runtime_dir, "converter_fm.sock")
+    return os.path.join(tempfile.gettempdir(), f"converter_fm-{os.getuid()}", "server.sock")
+
+
+def secure_socket_dir(socket_path):
+    """
+    Create the folder of the socket with mode 0700, and refuse one that is not
+    private to the current user: in a shared folder such as /tmp another user
+    could have taken the path first, to receive the jobs or send fake replies.
+    """
+    folder = os.path.dirname(os.path.abspath(socket_path))
+    os.makedirs(folder, mode=0o700, exist_ok=True)
+    info = os.lstat(folder)
+    if not stat.S_ISDIR(info.st_mode) or info.st_uid != os.getuid() or info.st_mode & 0o077:
+        raise PermissionError(f"{folder} must be a folder owned by you with mode 0700")
+
+
+DEFAULT_SOCKET = default_socket() if hasattr(os, "getuid") else None
+
+# ------------------------------ Worker Processes ------------------------------
+
+_status_queue = None  # Set in every worker by init_worker()
+
+
+def init_worker(status_queue):
+    """Runs once per worker process: keep the status queue and pre-import the backends."""
+    global _status_queue
+    _status_queue = status_queue
+    converter.warm_up_backends()
+
+
+def run_job(job_id, request):
+    """Run one conversion inside a worker process and return the reply fields."""
+    _status_queue.put((job_id, os.getpid()))
+    start = time.perf_counter()
+    # The handler checked that the job is the one convert_file() picks for the input
+    output = converter.convert_file(request["input"], request.get("target"), output_path=request.get("output"),
+                                    dtype=request.get("dtype"), usecols=request.get("usecols"))
+    return {"output": output, "seconds": round(time.perf_counter() - start, 6)}
+
+
+# ------------------------------ Socket Server ---------------------------------
+
+class ConversionHandler(socketserver.StreamRequestHandler):
+    """
+    One client connection: every request line is queued in the worker pool
+    right away, and status lines are streamed back as the jobs progress.
+    The connection closes once the client has stopped sending and every job is finished.
+    """
+
+    def handle(self):
+        outbox = queue.Queue()
+        state = {"pending": 0, "eof": False}
+        lock = threading.Lock()
+
+        def finished_one():
+            with lock:
+                state["pending"] -= 1
+                if state["eof"] and state["pending"] == 0:
+                    outbox.put(None)
+
+        writer = threading.Thread(target=self._write_replies, args=(outbox,), daemon=True)
+        writer.start()
+
+        try:
+            for line in self.rfile:
+                if not line.strip():
+                    continue
+                try:
+                    request = json.loads(line)
+                    if (not isinstance(request, dict) or request.get("job") not in JOBS
+                            or not isinstance(request.get("input"), str) or not request["input"]):
+                        raise ValueError(f"Expected a 'job' in {JOBS} and an 'input' path")
+                    for key in ("output", "target"):
+                        if request.get(key) is not None and not isinstance(request[key], str):
+                            raise ValueError(f"'{key}' must be a string")
+                    if job_for(request["input"])["job"] != request["job"]:
+                        raise ValueError(f"{request['job']} does not convert {request['input']}")
+                except ValueError as e:
+                    outbox.put({"id": None, "status": "failed", "error": str(e)})
+                    continue
+                with lock:
+                    state["pending"] += 1
+                self.server.submit(request, outbox, finished_one)
+        finally:
+            # Also when the client connection breaks: the writer must not wait forever
+            with lock:
+                state["eof"] = True
+                if state["pending"] == 0:
+                    outbox.put(None)
+            writer.join()
+
+    def _write_replies(self, outbox):
+        """Send every status message of this connection, until the None sentinel."""
+        while True:
+            message = outbox.get()
+            if message is None:
+                return
+            try:
+                self.wfile.write((json.dumps(message) + "\n").encode("utf-8"))
+                self.wfile.flush()
+            except OSError:
+                pass  # Client went away; keep draining so the jobs can finish
+
+
+class ConversionServer(socketserver.ThreadingUnixStreamServer):
+    """Unix socket server backed by a pool of pre-warmed worker processes."""
+
+    daemon_threads = True
+
+    def __init__(self, socket_path, workers=None):
+        if os.path.exists(socket_path):
+            os.unlink(socket_path)  # Stale socket of a previous run
+        super().__init__(socket_path, ConversionHandler)
+        os.chmod(socket_path, 0o600)  # Only the current user may submit jobs
+        self.socket_path = socket_path
+        self.workers = workers or os.cpu_count() or 1
+        # "spawn" so the workers start from a clean interpreter
+        context = multiprocessing.get_context("spawn")
+        self.context = context
+        self.status_queue = context.Queue()
+        self.pool = self._new_pool()
+        self.pool_lock = threading.Lock()
+        self.jobs = {}  # job id -> outbox of the connection that submitted it
+        self.jobs_lock = threading.Lock()
+        self.next_id = 0
+        threading.Thread(target=self._forward_running, daemon=True).start()
+
+    def _new_pool(self):
+        return ProcessPoolExecutor(max_workers=self.workers, mp_context=self.context,
+                                   initializer=init_worker, initargs=(self.status_queue,))
+
+    def renew_pool(self, broken):
+        """
+        A worker died (e.g. killed, or a crash in a native library) and took the
+        pool down: its jobs fail, and the next ones run in a new, pre-warmed pool.
+        """
+        with self.pool_lock:
+            if self.pool is not broken:
+                return  # Already renewed for another job of the same pool
+            broken.shutdown(wait=False)
+            self.pool = self._new_pool()
+            for _ in range(self.workers):
+                self.pool.submit(os.getpid)  # Start and warm up the workers now
+
+    def submit(self, request, outbox, on_finished):
+        """Queue a request in the pool and report its progress into outbox."""
+        with self.jobs_lock:
+            self.next_id += 1
+            job_id = self.next_id
+            self.jobs[job_id] = outbox
+        outbox.put({"id": job_id, "status": "queued", "job": request["job"], "input": request["input"]})
+
+        def done(future):
+            with self.jobs_lock:
+                self.jobs.pop(job_id, None)
+            try:
+                outbox.put({"id": job_id, "status": "done", **future.result()})
+            except BrokenProcessPool as e:
+                outbox.put({"id": job_id, "status": "failed", "error": f"Worker process died: {e}"})
+                self.renew_pool(pool)
+            except Exception as e:
+                outbox.put({"id": job_id, "status": "failed", "error": str(e)})
+            on_finished()
+
+        try:
+            pool = self.pool
+            try:
+                future = pool.submit(run_job, job_id, request)
+            except BrokenProcessPool:
+                # Broken by a job that has not reported back yet: this one has not started
+                self.renew_pool(pool)
+                pool = self.pool
+                future = pool.submit(run_job, job_id, request)
+        except Exception as e:  # E.g. the server is shutting down
+            with self.jobs_lock:
+                self.jobs.pop(job_id, None)
+            outbox.put({"id": job_id, "status": "failed", "error": str(e)})
+            on_finished()
+            return
+        future.add_done_callback(done)
+
+    def _forward_running(self):
+        """Turn the "job started" notes of the workers into "running" replies."""
+        while True:
+            job_id, pid = self.status_queue.get()
+            with self.jobs_lock:
+                outbox = self.jobs.get(job_id)
+            # A job can finish before its note arrives; then there is nothing to report
+            if outbox is not None:
+                outbox.put({"id": job_id, "status": "running", "pid": pid})
+
+    def server_close(self):
+        super().server_close()
+        self.pool.shutdown(cancel_futures=True)
+        if os.path.exists(self.socket_path):
+            os.unlink(self.socket_path)
+
+
+def serve(socket_path=DEFAULT_SOCKET, workers=None):
+    """Start the server and block until Ctrl+C or SIGTERM."""
+    # SIGTERM (e.g. from a service manager) exits cleanly and removes the socket too
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+    with ConversionServer(socket_path, workers) as server:
+        # Start (and warm up) every worker now instead of on the first job
+        for future in [server.pool.submit(os.getpid) for _ in range(server.workers)]:
+            future.result()
+        print(f"Converter server listening on {socket_path} with {server.workers} warm workers", flush=True)
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            print("\nShutting down")
+
+
+# -------------------------------- Thin Client ---------------------------------
+
+def job_for(path, target=None):
+    """Build the request for path, choosing the job from its extension like the GUI does."""
+    path = os.path.abspath(path)
+    ext = os.path.splitext(path)[1].lower()
+    if ext in converter.TABLE_FORMATS:
+        return {"job": "convert_table", "input": path, "target": target}
+    if ext == ".pdf":
+        return {"job": "pdf_to_docx_with_images", "input": path}
+    if ext in (".docx", ".doc"):
+        return {"job": "docx_doc_to_pdf", "input": path}
+    raise ValueError(f"Unsupported file type: {path}")
+
+
+def submit(requests, socket_path=DEFAULT_SOCKET):
+    """Send requests to a running server and yield every status message as it arrives."""
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.connect(socket_path)
+        payload = "".join(json.dumps(request) + "\n" for request in requests)
+        sock.sendall(payload.encode("utf-8"))
+        sock.shutdown(socket.SHUT_WR)  # No more jobs: the server closes once they are done
+        with sock.makefile("r", encoding="utf-8") as replies:
+            for line in replies:
+                yield json.loads(line)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[1])
+    parser.add_argument("--socket", default=DEFAULT_SOCKET, help="path of the Unix socket")
+    commands = parser.add_subparsers(dest="command", required=True)
+    serve_parser = commands.add_parser("serve", help="start the worker-pool server")
+    serve_parser.add_argument("--workers", type=int, default=None, help="worker processes (default: CPU count)")
+    submit_parser = commands.add_parser("submit", help="convert files through a running server")
+    submit_parser.add_argument("files", nargs="+", help="files to convert")
+    submit_parser.add_argument("--target", choices=converter.TABLE_FORMATS, help="target format for tables")
+    args = parser.parse_args()
+
+    if not hasattr(socket, "AF_UNIX"):
+        sys.exit("Unix sockets are not available on this platform")
+    try:
+        if args.socket == DEFAULT_SOCKET:
+            secure_socket_dir(args.socket)
+    except OSError as e:
+        sys.exit(f"[ERROR: {e}]")
+    if args.command == "serve":
+        serve(args.socket, args.workers)
+        return
+
+    failed = False
+    unfinished = set()  # Jobs queued by the server that have not reported done/failed yet
+    try:
+        requests = [job_for(path, args.target) for path in args.files]
+        for message in submit(requests, args.socket):
+            print(json.dumps(message), flush=True)
+            if message["status"] == "queued":
+                unfinished.add(message["id"])
+            elif message["status"] in ("done", "failed"):
+                unfinished.discard(message["id"])
+            failed = failed or message["status"] == "failed"
+    except (ValueError, OSError) as e:
+        sys.exit(f"[ERROR: {e}]")
+    if unfinished:
+        print(f"[ERROR: The server closed the connection before jobs {sorted(unfinished)} finished]",
+              file=sys.stderr)
+    sys.exit(1 if failed or unfinished else 0)
+
+
+if __name__ == "__main__":
+    main()
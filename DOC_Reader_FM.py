@@ -0,0 +1,332 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+@author: Federico Mollica
+
+Streaming reader for legacy binary Word documents (.doc, Word 97-2003).
+
+A .doc file is an OLE Compound File: a small FAT file system packed in one
+file. The text lives in its "WordDocument" stream, and the piece table that
+says where each run of text is stored lives in the "0Table"/"1Table" stream.
+This module reads only the sectors it needs and yields the document
+paragraph by paragraph, so memory stays bounded whatever the document size.
+
+Dependencies:
+- Python standard library only.
+
+Usage:
+    from DOC_Reader_FM import iter_doc_paragraphs
+    for paragraph in iter_doc_paragraphs("old_report.doc"):
+        print(paragraph)
+"""
+
+import re
+import struct
+import sys
+from array import array
+from collections import namedtuple
+
+# ----------------------------- Compound File ----------------------------------
+CFB_SIGNATURE = b"\xD0\xCF\x11\xE0\xA1\xB1\x1A\xE1"
+MAXREGSECT = 0xFFFFFFFA  # Sector numbers above this are markers (free, end of chain, ...)
+NOSTREAM = 0xFFFFFFFF
+STREAM_OBJECT = 2
+
+DirEntry = namedtuple("DirEntry", "name type left right child start size")
+
+
+def _sector_table(data):
+    """Unpack little-endian uint32 sector numbers into a compact array."""
+    table = array("I")
+    table.frombytes(data)
+    if sys.byteorder == "big":
+        table.byteswap()
+    return table
+
+
+class CompoundStream:
+    """Random-access, read-only view of one stream of a compound file."""
+
+    def __init__(self, read_run, chain, sector_size, size):
+        self._read_run = read_run      # read_run(first sector, skip, length) -> bytes
+        self._chain = chain
+        self._sector_size = sector_size
+        self.size = size
+
+    def read(self, offset, length):
+        """Read up to length bytes starting at offset (fewer at the end of the stream)."""
+        length = max(0, min(length, self.size - offset))
+        parts = []
+        while length > 0:
+            index, skip = divmod(offset, self._sector_size)
+            # Physically contiguous sectors are fetched with a single read
+            run = 1
+            while (run * self._sector_size - skip < length and index + run < len(self._chain)
+                   and self._chain[index + run] == self._chain[index] + run):
+                run += 1
+            take = min(run * self._sector_size - skip, length)
+            parts.append(self._read_run(self._chain[index], skip, take))
+            offset += take
+            length -= take
+        return b"".join(parts)
+
+
+class CompoundFile:
+    """
+    Minimal read-only OLE Compound File (MS-CFB) reader on an open binary file.
+    Only the allocation tables and the directory are kept in memory
+    (about 1/128 of the file size); stream data is read on demand.
+    """
+
+    def __init__(self, f):
+        self.f = f
+        f.seek(0)
+        header = f.read(512)
+        if len(header) < 512 or header[:8] != CFB_SIGNATURE:
+            raise ValueError("Not an OLE compound file, so not a Word 97-2003 .doc")
+        (major_version,) = struct.unpack_from("<H", header, 0x1A)
+        sector_shift, mini_shift = struct.unpack_from("<HH", header, 0x1E)
+        (num_fat, first_dir, _, self.mini_cutoff, first_mini_fat, num_mini_fat,
+         first_difat, num_difat) = struct.unpack_from("<8I", header, 0x2C)
+        self.sector_size = 1 << sector_shift
+        self.mini_sector_size = 1 << mini_shift
+        # Sectors present in the file (the header takes the place of one)
+        self.file_sectors = -(-f.seek(0, 2) // self.sector_size) - 1
+
+        # FAT sector numbers: the first 109 are in the header, the rest in the DIFAT chain
+        fat_sectors = list(struct.unpack_from("<109I", header, 0x4C))
+        per_sector = self.sector_size // 4 - 1
+        sector = first_difat
+        for _ in range(num_difat):
+            if sector > MAXREGSECT:
+                break
+            entries = _sector_table(self._read_sector(sector))
+            fat_sectors.extend(entries[:per_sector])
+            sector = entries[per_sector]
+        self.fat = array("I")
+        for sector in fat_sectors[:num_fat]:
+            self.fat.extend(_sector_table(self._read_sector(sector)))
+
+        # Directory: 128-byte entries in the chain starting at first_dir
+        directory = b"".join(self._read_sector(s) for s in self._regular_chain(first_dir))
+        self.entries = []
+        for offset in range(0, len(directory) - 127, 128):
+            name_length, kind = struct.unpack_from("<HB", directory, offset + 64)
+            left, right, child = struct.unpack_from("<3I", directory, offset + 68)
+            start, size_low, size_high = struct.unpack_from("<3I", directory, offset + 116)
+            # Version 3 files may leave garbage in the high half of the size
+            size = size_low if major_version == 3 else size_low | (size_high << 32)
+            name = directory[offset:offset + max(name_length - 2, 0)].decode("utf-16-le", errors="replace")
+            self.entries.append(DirEntry(name, kind, left, right, child, start, size))
+        if not self.entries:
+            raise ValueError("Corrupt compound file: empty directory")
+
+        # Small streams live in the mini stream, which is the root entry's own data
+        self.mini_fat = array("I")
+        if num_mini_fat:
+            for sector in self._regular_chain(first_mini_fat):
+                self.mini_fat.extend(_sector_table(self._read_sector(sector)))
+        root = self.entries[0]
+        self._mini_stream = CompoundStream(self._read_regular, self._regular_chain(root.start),
+                                           self.sector_size, root.size)
+
+    def _read_at(self, offset, length):
+        """Read exactly length bytes: a file cut short must not pass for a shorter document."""
+        self.f.seek(offset)
+        data = self.f.read(length)
+        if len(data) < length:
+            raise ValueError("Corrupt compound file: truncated")
+        return data
+
+    def _read_sector(self, sector):
+        return self._read_at((sector + 1) * self.sector_size, self.sector_size)
+
+    def _read_regular(self, sector, skip, length):
+        return self._read_at((sector + 1) * self.sector_size + skip, length)
+
+    def _read_mini(self, sector, skip, length):
+        return self._mini_stream.read(sector * self.mini_sector_size + skip, length)
+
+    @staticmethod
+    def _chain(start, table, sectors):
+        """Follow a sector chain through an allocation table; sectors: how many exist."""
+        chain = array("I")
+        sector = start
+        while sector < MAXREGSECT:
+            if sector >= sectors:
+                raise ValueError("Corrupt compound file: truncated")
+            if sector >= len(table) or len(chain) > len(table):
+                raise ValueError("Corrupt compound file: broken sector chain")
+            chain.append(sector)
+            sector = table[sector]
+        return chain
+
+    def _regular_chain(self, start):
+        return self._chain(start, self.fat, self.file_sectors)
+
+    def _mini_chain(self, start):
+        mini_sectors = -(-self._mini_stream.size // self.mini_sector_size)
+        return self._chain(start, self.mini_fat, mini_sectors)
+
+    def _find(self, name):
+        """Find a stream among the children of the root storage (a red-black tree)."""
+        pending = [self.entries[0].child]
+        while pending:
+            index = pending.pop()
+            if index == NOSTREAM or index >= len(self.entries):
+                continue
+            entry = self.entries[index]
+            if entry.type == STREAM_OBJECT and entry.name == name:
+                return entry
+            pending.extend((entry.left, entry.right))
+        return None
+
+    def has_stream(self, name):
+        return self._find(name) is not None
+
+    def open_stream(self, name):
+        """Return a CompoundStream for the top-level stream `name`."""
+        entry = self._find(name)
+        if entry is None:
+            raise ValueError(f"Stream '{name}' not found in the compound file")
+        if entry.size < self.mini_cutoff:
+            read_run, chain, sector_size = self._read_mini, self._mini_chain(entry.start), self.mini_sector_size
+        else:
+            read_run, chain, sector_size = self._read_regular, self._regular_chain(entry.start), self.sector_size
+        if len(chain) * sector_size < entry.size:
+            raise ValueError("Corrupt compound file: broken sector chain")
+        return CompoundStream(read_run, chain, sector_size, entry.size)
+
+
+# ------------------------------ Word Document ---------------------------------
+WORD_IDENT = 0xA5EC
+MIN_NFIB = 0x00C0          # Word 97; older (Word 6/95) files use another layout
+F_ENCRYPTED = 0x0100
+F_WHICH_TABLE = 0x0200     # Set: the table stream is "1Table", else "0Table"
+FC_CLX_INDEX = 33          # Position of fcClx/lcbClx in FibRgFcLcb97
+CHUNK_CHARS = 64 * 1024    # Characters decoded per read
+
+# Paragraph mark, cell/row mark, manual line break and page/section break
+PARAGRAPH_MARKS = re.compile("[\r\x07\x0b\x0c]")
+FIELD_MARKS = re.compile("([\x13\x14\x15])")
+# Non-breaking hyphen -> "-"; object/footnote/annotation anchors and stray field marks are dropped
+SPECIAL_CHARS = str.maketrans({"\x1e": "-", "\x1f": None, "\x00": None, "\x01": None, "\x02": None,
+                               "\x05": None, "\x08": None, "\x13": None, "\x14": None, "\x15": None})
+
+
+def read_fib(word):
+    """Return (table stream name, ccpText, fcClx, lcbClx) from the File Information Block."""
+    base = word.read(0, 34)
+    if len(base) < 34:
+        raise ValueError("Corrupt Word document: truncated header")
+    ident, nfib = struct.unpack_from("<HH", base, 0)
+    (flags,) = struct.unpack_from("<H", base, 0x0A)
+    if ident != WORD_IDENT:
+        raise ValueError("Not a Word document")
+    if nfib < MIN_NFIB:
+        raise ValueError("Word 6/95 .doc files are not supported, only Word 97-2003")
+    if flags & F_ENCRYPTED:
+        raise ValueError("Encrypted .doc files are not supported")
+
+    # FibBase, then three variable-length arrays, each preceded by its count
+    (csw,) = struct.unpack_from("<H", base, 32)
+    offset = 34 + csw * 2
+    (cslw,) = struct.unpack("<H", word.read(offset, 2))
+    fib_rg_lw = word.read(offset + 2, cslw * 4)
+    (ccp_text,) = struct.unpack_from("<I", fib_rg_lw, 12)
+    offset += 2 + cslw * 4
+    (cb_rg_fc_lcb,) = struct.unpack("<H", word.read(offset, 2))
+    if cb_rg_fc_lcb <= FC_CLX_INDEX:
+        raise ValueError("Corrupt Word document: no piece table")
+    fc_clx, lcb_clx = struct.unpack("<II", word.read(offset + 2 + FC_CLX_INDEX * 8, 8))
+    table = "1Table" if flags & F_WHICH_TABLE else "0Table"
+    return table, ccp_text, fc_clx, lcb_clx
+
+
+def read_pieces(clx):
+    """
+    Parse the piece table (Clx) into (first CP, last CP, file offset, compressed) runs.
+    Compressed pieces hold one cp1252 byte per character, the others UTF-16LE.
+    """
+    pos = 0
+    while pos < len(clx) and clx[pos] == 0x01:   # Prc entries (formatting): skipped
+        (cb_grpprl,) = struct.unpack_from("<h", clx, pos + 1)
+        pos += 3 + cb_grpprl
+    if pos >= len(clx) or clx[pos] != 0x02:
+        raise ValueError("Corrupt Word document: piece table not found")
+    (lcb,) = struct.unpack_from("<I", clx, pos + 1)
+    plc = clx[pos + 5:pos + 5 + lcb]
+    count = (lcb - 4) // 12
+    cps = struct.unpack_from(f"<{count + 1}I", plc, 0)
+    pieces = []
+    for i in range(count):
+        _, fc, _ = struct.unpack_from("<HIH", plc, 4 * (count + 1) + 8 * i)
+        compressed = bool(fc & 0x40000000)
+        fc &= 0x3FFFFFFF
+        pieces.append((cps[i], cps[i + 1], fc // 2 if compressed else fc, compressed))
+    return pieces
+
+
+def iter_doc_text(path, chunk_chars=CHUNK_CHARS):
+    """Yield the raw main-document text of a .doc file in chunks of at most chunk_chars."""
+    with open(path, "rb") as f:
+        cfb = CompoundFile(f)
+        word = cfb.open_stream("WordDocument")
+        table_name, ccp_text, fc_clx, lcb_clx = read_fib(word)
+        pieces = read_pieces(cfb.open_stream(table_name).read(fc_clx, lcb_clx))
+        for cp_start, cp_end, offset, compressed in pieces:
+            cp_end = min(cp_end, ccp_text)  # Footnotes, headers etc. follow the main text
+            if cp_start >= cp_end:
+                continue
+            width, codec = (1, "cp1252") if compressed else (2, "utf-16-le")
+            for first in range(cp_start, cp_end, chunk_chars):
+                chars = min(chunk_chars, cp_end - first)
+                data = word.read(offset + (first - cp_start) * width, chars * width)
+                yield data.decode(codec, errors="replace")
+
+
+def _strip_field_codes(text, fields):
+    """
+    Keep only the displayed result of fields: drop the text between a field
+    begin (0x13) and its separator (0x14). `fields` carries the open fields
+    across chunks, True while still in the field code.
+    """
+    kept = []
+    for token in FIELD_MARKS.split(text):
+        if token == "\x13":
+            fields.append(True)
+        elif token == "\x14":
+            if fields:
+                fields[-1] = False
+        elif token == "\x15":
+            if fields:
+                fields.pop()
+        elif not any(fields):
+            kept.append(token)
+    return "".join(kept)
+
+
+def iter_doc_paragraphs(path, chunk_chars=CHUNK_CHARS):
+    """
+    Yield the paragraphs of a Word 97-2003 .doc file one at a time.
+    Table cells come out as one paragraph each; field codes are replaced by their results.
+    """
+    fields = []
+    parts = []
+    for text in iter_doc_text(path, chunk_chars):
+        if fields or "\x13" in text:
+            text = _strip_field_codes(text, fields)
+        pieces = PARAGRAPH_MARKS.split(text.translate(SPECIAL_CHARS))
+        for piece in pieces[:-1]:
+            parts.append(piece)
+            yield "".join(parts)
+            parts = []
+        parts.append(pieces[-1])
+    if any(parts):
+        yield "".join(parts)
+
+
+if __name__ == "__main__":
+    # Quick check from the command line: python DOC_Reader_FM.py file.doc
+    for paragraph in iter_doc_paragraphs(sys.argv[1]):
+        print(paragraph)
@@ -12,8 +12,13 @@ Dependencies:
 import tkinter as tk
 from tkinter import filedialog, messagebox
 from tkinter.scrolledtext import ScrolledText
-import pandas as pd
 import string
+import threading
+import importlib
+
+# pandas is only needed to print the stats, so it is imported lazily (and
+# preloaded in a background thread once the window is shown) for a fast start
+WARM_UP_PANDAS = True
 
 def count_stats(text):
     total_characters = len(text)
@@ -37,6 +42,8 @@ def load_file():
 
     total_char, char_no_space, word_cnt = count_stats(content)
 
+    import pandas as pd
+
     # Create DataFrame and print to console
     stats_df = pd.DataFrame({
         "Total Characters": [total_char],
@@ -45,15 +52,23 @@ def load_file():
     })
     print(stats_df)
 
-root = tk.Tk()
-root.title("TXT_Character_Word_Counter_FM")
-root.geometry("650x500")
-root.config(bg="#F8FAFF")
+def warm_up_pandas():
+    """Import pandas in a daemon thread so the first file loads without the import delay."""
+    threading.Thread(target=importlib.import_module, args=("pandas",), daemon=True).start()
+
+if __name__ == "__main__":
+    root = tk.Tk()
+    root.title("TXT_Character_Word_Counter_FM")
+    root.geometry("650x500")
+    root.config(bg="#F8FAFF")
+
+    open_btn = tk.Button(root, text="Open TXT File", font=("Arial", 14), command=load_file, bg="#57a1f8", fg="white", width=18)
+    open_btn.pack(pady=18)
 
-open_btn = tk.Button(root, text="Open TXT File", font=("Arial", 14), command=load_file, bg="#57a1f8", fg="white", width=18)
-open_btn.pack(pady=18)
+    text_box = ScrolledText(root, font=("Arial", 12), height=25, width=75, wrap="word")
+    text_box.pack(padx=10, pady=8)
 
-text_box = ScrolledText(root, font=("Arial", 12), height=25, width=75, wrap="word")
-text_box.pack(padx=10, pady=8)
+    if WARM_UP_PANDAS:
+        root.after(200, warm_up_pandas)
 
-root.mainloop()
+    root.mainloop()
@@ -5,18 +5,23 @@ Created on Sun Oct 23 18:35:36 2022
 
 @author: Federico Mollica
 
-A Tkinter-based GUI application for converting between .xlsx and .csv files.
+A Tkinter-based GUI application for converting between .xlsx, .csv,
+.parquet and .feather (Arrow IPC) files.
 """
 
 import tkinter as tk
-from tkinter import Text, Label, Button, INSERT, END
+from tkinter import Text, Label, Button, Checkbutton, OptionMenu, StringVar, BooleanVar, INSERT, END
 from tkinter import filedialog
-import pandas as pd
+import threading
+# The table conversions live in XLSX_CSV_DOC_PDF_Converter_FM.py (same folder),
+# which imports pandas and pyarrow lazily inside the functions that use them
+from XLSX_CSV_DOC_PDF_Converter_FM import TABLE_FORMATS, AUTO_TARGET, convert_table, export_all_sheets, warm_up_backends
 
 # --------------------- Library Installation Instructions ----------------------
 # Tkinter and os are included with standard Python.
 # Pandas for spreadsheet support:       pip install pandas       or   conda install pandas
 # openpyxl (required for pandas .xlsx): pip install openpyxl     or   conda install openpyxl
+# pyarrow (for .parquet and .feather):  pip install pyarrow      or   conda install pyarrow
 
 
 # ------------------------------ Color Palette ---------------------------------
@@ -26,32 +31,13 @@ WHITE = "#FFFFFF"
 DEFAULT_FONT_STYLE = ("Arial", 16)
 ENTRY_FONT = ("Arial", 13)
 
-# ----------------------------- Main Window Setup ------------------------------
-root = tk.Tk()
-root.geometry("650x300")
-root.title("CSV_XLSX_Converter_FM")
-root.configure(bg=PURPLE)
-
-# Grid configuration for responsiveness and centering
-root.columnconfigure(0, weight=1)
-for r in range(5):
-    root.rowconfigure(r, weight=1)
-
-# ------------------------------ Filepath Entries ------------------------------
-
-# Entry for the file to convert
-input_label = Label(root, text="Input File", font=DEFAULT_FONT_STYLE, bg=PURPLE, fg=WHITE)
-input_label.grid(row=1, column=0, sticky="e", padx=(80, 10), pady=(5, 0))
-
-body = Text(root, font=ENTRY_FONT, height=1, width=42)
-body.grid(row=1, column=1, sticky="w", padx=(0, 60), pady=(5, 0))
-
-# Entry for the output file/resulting path
-output_label = Label(root, text="Output Path", font=DEFAULT_FONT_STYLE, bg=PURPLE, fg=WHITE)
-output_label.grid(row=3, column=0, sticky="e", padx=(80, 10), pady=(5, 0))
-
-link = Text(root, font=ENTRY_FONT, height=1, width=42)
-link.grid(row=3, column=1, sticky="w", padx=(0, 60), pady=(5, 0))
+# ------------------------------ Lazy Backends ---------------------------------
+# pandas and pyarrow take a long time to import, so they are only imported by the
+# first conversion and the window appears right away. With WARM_UP_BACKENDS they
+# are also preloaded in a background thread once the window is shown.
+# Table settings (SAMPLE_ROWS, CHUNK_ROWS, CSV_ENGINE, ...) are in XLSX_CSV_DOC_PDF_Converter_FM.py.
+WARM_UP_BACKENDS = True
+WARM_UP_DELAY_MS = 200  # Delay after the first paint before the warm-up starts
 
 # ------------------------------ Functions -------------------------------------
 
@@ -67,40 +53,94 @@ def clearFile():
     body.delete(1.0, END)
     link.delete(1.0, END)
 
+def start_warm_up():
+    """Import the table backends in a daemon thread, keeping the GUI responsive."""
+    threading.Thread(target=warm_up_backends, args=(['tables'],), daemon=True).start()
+
 def conversion():
     """
-    Convert .xlsx to .csv or .csv to .xlsx.
+    Convert between .xlsx, .csv, .parquet and .feather.
     Show new path or error.
     """
     insert_path = body.get("1.0", 'end-1c').strip()
     link.delete(1.0, END)
     try:
-        if insert_path.endswith('.xlsx'):
-            new_path = insert_path.replace('.xlsx', '.csv')
-            pd.read_excel(insert_path).to_csv(new_path, index=False)
-            link.insert(INSERT, new_path)
-        elif insert_path.endswith('.csv'):
-            new_path = insert_path.replace('.csv', '.xlsx')
-            pd.read_csv(insert_path).to_excel(new_path, index=False)
+        if insert_path.lower().endswith('.xlsx') and all_sheets.get():
+            target = target_format.get()
+            new_paths = export_all_sheets(insert_path, AUTO_TARGET['.xlsx'] if target == "Auto" else target)
+            link.insert(INSERT, "; ".join(new_paths))
+        elif insert_path.lower().endswith(TABLE_FORMATS):
+            target = target_format.get()
+            new_path = convert_table(insert_path, None if target == "Auto" else target)
             link.insert(INSERT, new_path)
         else:
-            link.insert(INSERT, "[ERROR: Please select a .csv or .xlsx file]")
+            link.insert(INSERT, "[ERROR: Please select a .csv, .xlsx, .parquet or .feather file]")
     except Exception as e:
         link.insert(INSERT, f"[ERROR: {e}]")
 
-# ------------------------------ Button Row ------------------------------------
 
-button_frame = tk.Frame(root, bg=PURPLE)
-button_frame.grid(row=0, column=0, columnspan=2, pady=(35,15))
+if __name__ == "__main__":
+    # ----------------------------- Main Window Setup --------------------------
+    root = tk.Tk()
+    root.geometry("650x300")
+    root.title("CSV_XLSX_Converter_FM")
+    root.configure(bg=PURPLE)
+
+    # Grid configuration for responsiveness and centering
+    root.columnconfigure(0, weight=1)
+    for r in range(5):
+        root.rowconfigure(r, weight=1)
+
+    # ------------------------------ Filepath Entries --------------------------
+
+    # Entry for the file to convert
+    input_label = Label(root, text="Input File", font=DEFAULT_FONT_STYLE, bg=PURPLE, fg=WHITE)
+    input_label.grid(row=1, column=0, sticky="e", padx=(80, 10), pady=(5, 0))
+
+    body = Text(root, font=ENTRY_FONT, height=1, width=42)
+    body.grid(row=1, column=1, sticky="w", padx=(0, 60), pady=(5, 0))
+
+    # Target format ("Auto" keeps the original xlsx <-> csv behaviour)
+    format_label = Label(root, text="Output Format", font=DEFAULT_FONT_STYLE, bg=PURPLE, fg=WHITE)
+    format_label.grid(row=2, column=0, sticky="e", padx=(80, 10), pady=(5, 0))
+
+    format_frame = tk.Frame(root, bg=PURPLE)
+    format_frame.grid(row=2, column=1, sticky="w", padx=(0, 60), pady=(5, 0))
+
+    target_format = StringVar(root, value="Auto")
+    format_menu = OptionMenu(format_frame, target_format, "Auto", *TABLE_FORMATS)
+    format_menu.config(bg=REDDISH, fg=WHITE, font=ENTRY_FONT, width=10)
+    format_menu.pack(side="left")
+
+    # Export every sheet of an .xlsx workbook to its own file
+    all_sheets = BooleanVar(root, value=False)
+    sheets_check = Checkbutton(format_frame, text="All sheets", variable=all_sheets, font=ENTRY_FONT,
+                               bg=PURPLE, fg=WHITE, selectcolor=REDDISH, activebackground=PURPLE)
+    sheets_check.pack(side="left", padx=(12, 0))
+
+    # Entry for the output file/resulting path
+    output_label = Label(root, text="Output Path", font=DEFAULT_FONT_STYLE, bg=PURPLE, fg=WHITE)
+    output_label.grid(row=3, column=0, sticky="e", padx=(80, 10), pady=(5, 0))
+
+    link = Text(root, font=ENTRY_FONT, height=1, width=42)
+    link.grid(row=3, column=1, sticky="w", padx=(0, 60), pady=(5, 0))
+
+    # ------------------------------ Button Row --------------------------------
+
+    button_frame = tk.Frame(root, bg=PURPLE)
+    button_frame.grid(row=0, column=0, columnspan=2, pady=(35,15))
+
+    open_btn = Button(button_frame, text="Open File", bg=REDDISH, fg=WHITE, font=DEFAULT_FONT_STYLE, width=12, command=search_for_file_path)
+    open_btn.pack(side="left", padx=8)
 
-open_btn = Button(button_frame, text="Open File", bg=REDDISH, fg=WHITE, font=DEFAULT_FONT_STYLE, width=12, command=search_for_file_path)
-open_btn.pack(side="left", padx=8)
+    convert_btn = Button(button_frame, text="Convert", bg=REDDISH, fg=WHITE, font=DEFAULT_FONT_STYLE, width=12, command=conversion)
+    convert_btn.pack(side="left", padx=8)
 
-convert_btn = Button(button_frame, text="Convert", bg=REDDISH, fg=WHITE, font=DEFAULT_FONT_STYLE, width=12, command=conversion)
-convert_btn.pack(side="left", padx=8)
+    clear_btn = Button(button_frame, text="Clear", bg=REDDISH, fg=WHITE, font=DEFAULT_FONT_STYLE, width=12, command=clearFile)
+    clear_btn.pack(side="left", padx=8)
 
-clear_btn = Button(button_frame, text="Clear", bg=REDDISH, fg=WHITE, font=DEFAULT_FONT_STYLE, width=12, command=clearFile)
-clear_btn.pack(side="left", padx=8)
+    # ------------------------------ Run App! ----------------------------------
+    if WARM_UP_BACKENDS:
+        root.after(WARM_UP_DELAY_MS, start_warm_up)
 
-# ------------------------------ Run App! --------------------------------------
-root.mainloop()
+    root.mainloop()
@@ -6,26 +6,47 @@ Created on Sun Oct 23 18:35:36 2022
 @author: Federico Mollica
 
 A Tkinter-based GUI application for:
-- .xlsx <-> .csv file conversion using pandas/openpyxl
+- .xlsx / .csv / .parquet / .feather table conversion using pandas/openpyxl/pyarrow
 - .pdf <-> .docx file conversion (pdf2docx: keeps text & images from PDF)
 - .doc or .docx to .pdf conversion (using python-docx and reportlab)
 """
 
 import tkinter as tk
-from tkinter import Text, Label, Button, INSERT, END, filedialog
+from tkinter import Text, Label, Button, Checkbutton, OptionMenu, StringVar, BooleanVar, INSERT, END, filedialog
 import os
-import pandas as pd
-from pdf2docx import Converter  # Improved: handles images!
-from docx import Document
-from reportlab.pdfgen import canvas as pdf_canvas
-from reportlab.lib.pagesizes import A4
-import docx2txt
+import io
+import sys
+import csv
+import json
+import time
+import codecs
+import cProfile
+import hashlib
+import threading
+import multiprocessing
+from contextlib import contextmanager, nullcontext
+from datetime import datetime
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from itertools import repeat
+import importlib
+import zipfile
+# pandas, pyarrow, pdf2docx, python-docx and reportlab are imported
+# lazily inside the functions that use them (see BACKENDS below)
+from DOC_Reader_FM import iter_doc_paragraphs  # Standard library only
+
+try:
+    import resource  # Peak RSS fallback on Unix systems without /proc (e.g. macOS)
+except ImportError:
+    resource = None
 
 # --------------------------- Library Installation -----------------------------
 # Tkinter and os are included with standard Python.
 # Additional dependencies:
-# pip install pandas openpyxl pillow pdf2docx python-docx reportlab docx2txt
+# pip install pandas openpyxl pyarrow pillow pdf2docx python-docx reportlab
 # pdf2docx: enables PDF to DOCX conversion with images/styles
+# pyarrow: enables .parquet and .feather (Arrow IPC) tables
+# pikepdf (optional): smaller PDF output and "fast web view" (see PDF Output below)
+# Legacy .doc files are read by DOC_Reader_FM.py (same folder, no dependencies)
 # -----------------------------------------------------------------------------
 
 # ------------------------------ Color Palette ---------------------------------
@@ -35,41 +56,197 @@ WHITE = "#FFFFFF"
 DEFAULT_FONT_STYLE = ("Arial", 20)
 ENTRY_FONT_STYLE = ("Arial", 14)
 
-# ----------------------------- Main Window Setup ------------------------------
-root = tk.Tk()
-root.geometry("760x320")
-root.title("Converter_FM")
-root.config(bg=PURPLE)
-root.columnconfigure(0, weight=1)
-for r in range(5):
-    root.rowconfigure(r, weight=1)
+# ------------------------------ Table Formats ---------------------------------
+TABLE_FORMATS = ('.csv', '.xlsx', '.parquet', '.feather')
+# Target used for each source when "Auto" is selected (keeps the original xlsx <-> csv behaviour)
+AUTO_TARGET = {'.xlsx': '.csv', '.csv': '.xlsx', '.parquet': '.csv', '.feather': '.csv'}
+SAMPLE_ROWS = 10000    # Rows read up front to infer the column types of a CSV
+CHUNK_ROWS = 100000    # Rows per chunk when streaming a CSV into Parquet/Feather
+
+# ------------------------------ CSV Parsing -----------------------------------
+CSV_ENGINE = 'pyarrow'     # pandas parser for whole-file reads: 'pyarrow', 'c' or 'python'
+SNIFF_BYTES = 64 * 1024    # Bytes read to detect the encoding and the delimiter
+CATEGORY_RATIO = 0.05      # Text columns with fewer distinct values per row become categorical
+
+# ------------------------------ DOCX to PDF -----------------------------------
+MARGIN = 40            # Page margin in points
+LINE_HEIGHT = 20       # Distance between text lines in points
+LINE_CHARS = 120       # Characters per line before wrapping
+FONT = ('Helvetica', 12)  # reportlab's default font, used unless PDF_FONT_FILE is set
+IMAGE_DPI = 150        # Images are downscaled to this resolution at their printed size
+JPEG_QUALITY = 85      # Quality of photos re-encoded after downscaling
+IMAGE_WORKERS = None   # Threads decoding the images (None: ThreadPoolExecutor default)
+EMU_PER_POINT = 12700  # DOCX sizes are in English Metric Units
+
+# ------------------------------ PDF Output ------------------------------------
+PDF_OPTIMIZE = True    # Rewrite the PDF with pikepdf (when installed) once it is written
+PDF_COMPRESSION = 9    # zlib level of the rewritten streams: 1 (fastest) to 9 (smallest)
+PDF_LINEARIZE = False  # "Fast web view": the first page shows before the rest has downloaded
+PDF_FONT_FILE = None   # Optional .ttf for text beyond Latin-1, embedded as a subset of the glyphs used
+
+# ------------------------------ Lazy Backends ---------------------------------
+# The heavy libraries take seconds to import, so they are only imported the first
+# time a format needs them and the window appears right away. With WARM_UP_BACKENDS
+# they are also preloaded in a background thread once the window is shown.
+BACKENDS = {
+    'tables': ('pandas', 'pyarrow', 'pyarrow.feather', 'pyarrow.parquet'),
+    'pdf_to_docx': ('pdf2docx',),
+    'docx_to_pdf': ('docx', 'reportlab.pdfgen.canvas', 'reportlab.lib.pagesizes', 'reportlab.lib.utils', 'PIL.Image', 'pikepdf'),
+}
+WARM_UP_BACKENDS = True
+WARM_UP_DELAY_MS = 200  # Delay after the first paint before the warm-up starts
+
+
+def warm_up_backends(groups=None):
+    """
+    Import the backends of the given BACKENDS groups (all by default),
+    so the first conversion does not pay for the imports.
+    """
+    for group in groups or BACKENDS:
+        for module in BACKENDS[group]:
+            try:
+                importlib.import_module(module)
+            except ImportError:
+                pass  # Reported by the conversion that actually needs it
+
+def start_warm_up():
+    """Run warm_up_backends() in a daemon thread, keeping the GUI responsive."""
+    threading.Thread(target=warm_up_backends, daemon=True).start()
+
+# ------------------------------ Instrumentation -------------------------------
+# CONVERTER_METRICS: file that receives one JSON line of metrics per conversion.
+# CONVERTER_PROFILE_DIR: folder that receives one cProfile .prof dump per conversion.
+METRICS_PATH = os.environ.get('CONVERTER_METRICS')
+PROFILE_DIR = os.environ.get('CONVERTER_PROFILE_DIR')
+RSS_SAMPLE_SECONDS = 0.01  # Interval of the RSS sampler thread
+
+
+def current_rss_bytes():
+    """Current resident set size of this process in bytes, None where /proc is missing."""
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError, AttributeError):
+        return None
 
-container = tk.Frame(root, bg=PURPLE)
-container.grid(column=0, row=0, rowspan=5, padx=0, pady=10, sticky="nsew")
+def process_peak_rss_bytes():
+    """Peak RSS of the whole process lifetime in bytes, None on Windows."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # macOS reports bytes, Linux kilobytes
+    return peak if sys.platform == 'darwin' else peak * 1024
+
+
+class ConversionMetrics:
+    """
+    Instrumentation of one conversion, used as a context manager:
+    per-stage wall time (read, transform, write), peak RSS sampled by a
+    background thread, bytes in/out and rows processed. On exit the
+    record is appended as one JSON line to metrics_path and the cProfile
+    stats are dumped to profile_dir, when those are set.
+    """
 
-for i in range(7):
-    container.rowconfigure(i, weight=1)
-container.columnconfigure(0, weight=1)
-container.columnconfigure(1, weight=1)
+    def __init__(self, job, input_path, output_path=None, metrics_path=None, profile_dir=None):
+        self.metrics_path = metrics_path or METRICS_PATH
+        self.profile_dir = profile_dir or PROFILE_DIR
+        self.record = {
+            'timestamp': None, 'job': job, 'input': input_path, 'output': output_path,
+            'status': None, 'error': None, 'total_seconds': None, 'stages': {},
+            'rows': None, 'input_bytes': None, 'output_bytes': None,
+            'peak_rss_bytes': None, 'pid': os.getpid(),
+        }
+        self._peak_rss = 0
+        self._stop = threading.Event()
+        self._sampler = None
+        self._profiler = None
+        self._start = None
 
-title = Label(container, text="File Converter", font=("Arial", 28, "bold"),
-              bg=PURPLE, fg=WHITE)
-title.grid(row=0, column=0, columnspan=2, pady=(10,5), sticky="n")
+    def __enter__(self):
+        self.record['timestamp'] = datetime.now().isoformat(timespec='seconds')
+        if os.path.isfile(self.record['input']):
+            self.record['input_bytes'] = os.path.getsize(self.record['input'])
+        if self.metrics_path and current_rss_bytes() is not None:
+            self._sampler = threading.Thread(target=self._sample_rss, daemon=True)
+            self._sampler.start()
+        if self.profile_dir:
+            self._profiler = cProfile.Profile()
+            self._profiler.enable()
+        self._start = time.perf_counter()
+        return self
 
-body_label = Label(container, text="Input File:", font=ENTRY_FONT_STYLE, bg=PURPLE, fg=WHITE, anchor="e")
-body_label.grid(row=1, column=0, sticky="e", padx=(40, 8), pady=4)
+    def __exit__(self, exc_type, exc, tb):
+        self.record['total_seconds'] = round(time.perf_counter() - self._start, 6)
+        if self._profiler is not None:
+            self._profiler.disable()
+            os.makedirs(self.profile_dir, exist_ok=True)
+            stamp = datetime.now().strftime('%Y%m%d-%H%M%S-%f')
+            self._profiler.dump_stats(os.path.join(self.profile_dir, f"{self.record['job']}-{stamp}-{os.getpid()}.prof"))
+        if self._sampler is not None:
+            self._stop.set()
+            self._sampler.join()
+        self.record['peak_rss_bytes'] = self._peak_rss or process_peak_rss_bytes()
+        self.record['status'] = 'failed' if exc_type else 'done'
+        self.record['error'] = str(exc) if exc else None
+        output_path = self.record['output']
+        if output_path and os.path.isfile(output_path):
+            self.record['output_bytes'] = os.path.getsize(output_path)
+        self.record['stages'] = {name: round(seconds, 6) for name, seconds in self.record['stages'].items()}
+        if self.metrics_path:
+            with open(self.metrics_path, 'a', encoding='utf-8') as f:
+                f.write(json.dumps(self.record) + '\n')
+        return False  # Never swallow the exception
 
-body = Text(container, font=ENTRY_FONT_STYLE, height=1, width=45)
-body.grid(row=1, column=1, sticky="w", padx=(0, 40), pady=4)
+    def _sample_rss(self):
+        """Track the highest RSS seen until the conversion finishes."""
+        while True:
+            self._peak_rss = max(self._peak_rss, current_rss_bytes() or 0)
+            if self._stop.wait(RSS_SAMPLE_SECONDS):
+                return
 
-link_label = Label(container, text="Output Path:", font=ENTRY_FONT_STYLE, bg=PURPLE, fg=WHITE, anchor="e")
-link_label.grid(row=2, column=0, sticky="e", padx=(40, 8), pady=4)
+    @contextmanager
+    def stage(self, name):
+        """Time a block of code; a stage entered several times (e.g. per chunk) adds up."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            stages = self.record['stages']
+            stages[name] = stages.get(name, 0.0) + time.perf_counter() - start
 
-link = Text(container, font=ENTRY_FONT_STYLE, height=1, width=45)
-link.grid(row=2, column=1, sticky="w", padx=(0, 40), pady=4)
+    def add_rows(self, rows):
+        """Count rows (or paragraphs/pages for documents) processed."""
+        self.record['rows'] = (self.record['rows'] or 0) + rows
 
-btn_frame = tk.Frame(container, bg=PURPLE)
-btn_frame.grid(row=3, column=0, columnspan=2, pady=16)
+    def note(self, **fields):
+        """Add job-specific fields to the record (e.g. the PDF optimization report)."""
+        self.record.update(fields)
+
+
+def stage(metrics, name):
+    """metrics.stage(name), or a no-op when the caller passed no metrics."""
+    return metrics.stage(name) if metrics is not None else nullcontext()
+
+# ------------------------------ Output Files ----------------------------------
+
+@contextmanager
+def atomic_output(path):
+    """
+    Yield a temporary path next to `path` to write the output to; it is moved
+    over `path` only when the block succeeds. An interrupted or failed conversion
+    never leaves a truncated file behind, nor replaces a previous good one.
+    The temporary name keeps the extension, so writers pick the same format.
+    """
+    base, ext = os.path.splitext(path)
+    temp_path = f"{base}.partial-{os.getpid()}{ext}"
+    try:
+        yield temp_path
+        os.replace(temp_path, path)
+    finally:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+
+# ------------------------------ Functions -------------------------------------
 
 def search_for_file_path():
     """Open file dialog and display selected path."""
@@ -84,97 +261,777 @@ def clearFile():
     body.delete(1.0, END)
     link.delete(1.0, END)
 
-def docx_doc_to_pdf(input_path, output_path):
+def sniff_csv(insert_path):
     """
-    Convert DOCX or DOC file to PDF.
-    Reads text, one paragraph per line, and writes to PDF using reportlab.
+    Detect the encoding and the delimiter of a CSV from its first SNIFF_BYTES.
+    Returns them as keyword arguments for pd.read_csv.
+    """
+    with open(insert_path, 'rb') as f:
+        raw = f.read(SNIFF_BYTES)
+    if raw.startswith(codecs.BOM_UTF8):
+        encoding = 'utf-8-sig'
+    elif raw.startswith((codecs.BOM_UTF16_LE, codecs.BOM_UTF16_BE)):
+        encoding = 'utf-16'
+    else:
+        try:
+            raw.decode('utf-8')
+            encoding = 'utf-8'
+        except UnicodeDecodeError as e:
+            # A full sample may simply end in the middle of a multi-byte character
+            cut_short = len(raw) == SNIFF_BYTES and e.start >= len(raw) - 3
+            encoding = 'utf-8' if cut_short else 'latin-1'
+    sample = raw.decode(encoding, errors='ignore')
+    if len(raw) == SNIFF_BYTES:
+        # Only sniff complete lines, the last one is cut by the sample size
+        sample = sample.rsplit('\n', 1)[0]
+    try:
+        delimiter = csv.Sniffer().sniff(sample, delimiters=',;\t|').delimiter
+    except csv.Error:
+        delimiter = ','
+    return {'encoding': encoding, 'sep': delimiter}
+
+def categorize(df, max_ratio=CATEGORY_RATIO):
+    """
+    Convert low-cardinality text columns (at most max_ratio distinct values
+    per row) to the category dtype, which stores every distinct value once.
+    """
+    if not max_ratio:
+        return df
+    for column in df.select_dtypes(include=['object', 'string']).columns:
+        if df[column].nunique() <= max_ratio * len(df):
+            df[column] = df[column].astype('category')
+    return df
+
+def read_csv_fast(insert_path, engine=CSV_ENGINE, dtype=None, usecols=None, max_ratio=CATEGORY_RATIO):
+    """
+    Read a whole CSV with the chosen parser engine ('pyarrow', 'c' or 'python').
+    dtype and usecols are hints: typed columns skip inference and columns
+    not listed in usecols are never materialised.
+    Without pyarrow installed, the 'pyarrow' engine falls back to 'c'.
+    """
+    import pandas as pd
+    if engine == 'pyarrow':
+        try:
+            import pyarrow  # noqa: F401
+        except ImportError:
+            engine = 'c'  # pyarrow is only required for .parquet and .feather
+    df = pd.read_csv(insert_path, engine=engine, dtype=dtype, usecols=usecols, **sniff_csv(insert_path))
+    return categorize(df, max_ratio)
+
+def infer_csv_types(insert_path, dtype=None, usecols=None):
+    """
+    Infer the column types of a CSV once, from its first SAMPLE_ROWS rows.
+    Returns the pandas dtypes to read every following chunk with, the Arrow
+    schema of the whole file and the sniffed read_csv options. Explicit dtype
+    hints win over the sample. Since the sample may not show every value:
+    - columns empty in the sample are stored as text;
+    - integer columns are read as text and parsed exactly by chunk_to_arrow(),
+      so missing values or integers above 2**53 never go through floats;
+    - other numbers are parsed per chunk and checked against the schema afterwards.
+    """
+    import pandas as pd
+    import pyarrow as pa
+    options = sniff_csv(insert_path)
+    raw = pd.read_csv(insert_path, nrows=SAMPLE_ROWS, dtype=dtype, usecols=usecols, **options)
+    if dtype is not None and not isinstance(dtype, dict):
+        # One dtype for every column: nothing left to infer
+        return dtype, pa.Schema.from_pandas(raw, preserve_index=False), options
+    sample = raw.convert_dtypes()
+    read_dtypes = dict(dtype or {})
+    for column in read_dtypes:
+        if column in sample:
+            sample[column] = raw[column]  # As hinted: convert_dtypes() would turn 1.0, 2.0 into Int64
+    for column in sample.columns:
+        if column in read_dtypes:
+            continue
+        if sample[column].isna().all():
+            sample[column] = sample[column].astype('string')
+        if pd.api.types.is_string_dtype(sample[column]) or pd.api.types.is_integer_dtype(sample[column]):
+            read_dtypes[column] = 'string'
+    return read_dtypes, pa.Schema.from_pandas(sample, preserve_index=False), options
+
+def chunk_to_arrow(chunk, schema):
+    """
+    Convert a CSV chunk to an Arrow table with the schema inferred on the sample.
+    Integer columns read as text are parsed by Arrow, which fails on any value
+    that is not an integer. Raises ValueError naming the column that does not fit.
+    """
+    import pandas as pd
+    import pyarrow as pa
+    arrays = []
+    for field in schema:
+        column = chunk[field.name]
+        try:
+            if pa.types.is_integer(field.type) and pd.api.types.is_string_dtype(column):
+                arrays.append(pa.Array.from_pandas(column).cast(field.type))
+            else:
+                arrays.append(pa.Array.from_pandas(column, type=field.type))
+        except (pa.ArrowInvalid, pa.ArrowTypeError) as e:
+            raise ValueError(f"Column '{field.name}' does not fit the type {field.type} inferred from "
+                             f"the first {SAMPLE_ROWS} rows ({e}); pass a dtype hint for it") from e
+    return pa.Table.from_arrays(arrays, schema=schema)
+
+def arrow_compatible(df):
+    """
+    Store as text the object columns that mix value types (e.g. numbers and
+    text in one Excel column): Arrow formats need one type per column.
+    """
+    for column in df.select_dtypes(include='object').columns:
+        if df[column].dropna().map(type).nunique() > 1:
+            df[column] = df[column].astype('string')
+    return df
+
+def load_memory_mapped(path):
+    """
+    Load a .feather file zero-copy through a memory map.
+    The returned pyarrow.Table points straight at the file pages,
+    so only the columns actually used are ever read from disk.
+    """
+    import pyarrow.feather as feather
+    return feather.read_table(path, memory_map=True)
+
+def read_table(insert_path, **csv_options):
+    """
+    Read any supported table file into a DataFrame.
+    csv_options (engine, dtype, usecols, max_ratio) are passed to read_csv_fast.
+    """
+    import pandas as pd
+    ext = os.path.splitext(insert_path)[1].lower()
+    if ext == '.xlsx':
+        return pd.read_excel(insert_path, engine='openpyxl')
+    if ext == '.csv':
+        return read_csv_fast(insert_path, **csv_options)
+    if ext == '.parquet':
+        import pyarrow.parquet as pq
+        return pq.read_table(insert_path, memory_map=True).to_pandas()
+    if ext == '.feather':
+        return load_memory_mapped(insert_path).to_pandas()
+    raise ValueError(f"Unsupported table format: {ext}")
+
+def write_table(df, new_path):
+    """Write a DataFrame to any supported table format."""
+    ext = os.path.splitext(new_path)[1].lower()
+    if ext not in TABLE_FORMATS:
+        raise ValueError(f"Unsupported table format: {ext}")
+    with atomic_output(new_path) as temp_path:
+        if ext == '.xlsx':
+            df.to_excel(temp_path, index=False, engine='openpyxl')
+        elif ext == '.csv':
+            df.to_csv(temp_path, index=False)
+        elif ext == '.parquet':
+            arrow_compatible(df).to_parquet(temp_path, index=False)
+        else:
+            # Uncompressed so the file can be memory mapped without decoding
+            arrow_compatible(df).reset_index(drop=True).to_feather(temp_path, compression='uncompressed')
+
+def stream_csv_to_arrow(insert_path, new_path, dtype=None, usecols=None, metrics=None):
+    """
+    Stream a CSV into a .parquet or .feather file chunk by chunk.
+    Types are inferred once on a sample and then fixed for every chunk,
+    so memory stays bounded by CHUNK_ROWS whatever the size of the file.
+    metrics (a ConversionMetrics) receives the per-chunk stage timings.
+    """
+    import pandas as pd
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    with stage(metrics, 'read'):  # Sniffing and the type sample
+        dtypes, schema, options = infer_csv_types(insert_path, dtype, usecols)
+    with atomic_output(new_path) as temp_path:
+        if new_path.lower().endswith('.parquet'):
+            writer = pq.ParquetWriter(temp_path, schema)
+        else:
+            # A Feather v2 file is an Arrow IPC file; left uncompressed for memory mapping
+            writer = pa.ipc.new_file(temp_path, schema)
+        try:
+            # Chunked reads need the 'c' engine, the pyarrow parser has no chunksize
+            chunks = pd.read_csv(insert_path, dtype=dtypes, usecols=usecols, chunksize=CHUNK_ROWS, **options)
+            while True:
+                with stage(metrics, 'read'):
+                    chunk = next(chunks, None)
+                if chunk is None:
+                    break
+                with stage(metrics, 'transform'):
+                    table = chunk_to_arrow(chunk, schema)
+                with stage(metrics, 'write'):
+                    writer.write_table(table)
+                if metrics is not None:
+                    metrics.add_rows(len(chunk))
+        finally:
+            writer.close()
+
+def output_path_for(insert_path, target_ext=None):
+    """
+    Path of the file that converting insert_path writes: tables to target_ext
+    (or the AUTO_TARGET default), .pdf -> .docx and .docx/.doc -> .pdf.
+    Every converter (GUI, server, batch) names its outputs with this function.
+    """
+    base, ext = os.path.splitext(insert_path)
+    ext = ext.lower()
+    if ext in TABLE_FORMATS:
+        return base + (target_ext or AUTO_TARGET[ext])
+    if ext == '.pdf':
+        return base + '.docx'
+    if ext in ('.docx', '.doc'):
+        return base + '.pdf'
+    raise ValueError(f"Unsupported file type: {insert_path}")
+
+def convert_table(insert_path, target_ext=None, output_path=None, **csv_options):
+    """
+    Convert a table file to the format given by target_ext
+    (one of TABLE_FORMATS, or None for the format of output_path or the AUTO_TARGET default).
+    output_path overrides output_path_for() and must have the target extension.
+    csv_options are the CSV parsing hints of read_csv_fast.
+    Returns the path of the new file.
+    """
+    source_ext = os.path.splitext(insert_path)[1].lower()
+    if source_ext not in TABLE_FORMATS:
+        raise ValueError(f"Unsupported table format: {source_ext}")
+    output_ext = os.path.splitext(output_path)[1].lower() if output_path else None
+    target_ext = target_ext or output_ext or AUTO_TARGET[source_ext]
+    if target_ext == source_ext:
+        raise ValueError(f"The file is already a {source_ext} file")
+    if output_path and output_ext != target_ext:
+        raise ValueError(f"The output of a {target_ext} conversion must end in {target_ext}: {output_path}")
+    new_path = output_path or output_path_for(insert_path, target_ext)
+    with ConversionMetrics('convert_table', insert_path, new_path) as metrics:
+        if source_ext == '.csv' and target_ext in ('.parquet', '.feather'):
+            stream_csv_to_arrow(insert_path, new_path, csv_options.get('dtype'), csv_options.get('usecols'), metrics)
+        else:
+            with metrics.stage('read'):
+                df = read_table(insert_path, **csv_options)
+            metrics.add_rows(len(df))
+            with metrics.stage('write'):
+                write_table(df, new_path)
+    return new_path
+
+def paragraph_images(paragraph):
+    """Yield (relationship id, width, height in points) of the pictures in a DOCX paragraph."""
+    for drawing in paragraph._p.xpath('.//wp:inline | .//wp:anchor'):
+        extent = drawing.xpath('./wp:extent')
+        r_ids = drawing.xpath('.//a:blip/@r:embed')
+        if extent and r_ids:
+            yield (r_ids[0], int(extent[0].get('cx')) / EMU_PER_POINT,
+                   int(extent[0].get('cy')) / EMU_PER_POINT)
+
+def fit_size(width, height, max_width, max_height):
+    """Scale (width, height) down, keeping the aspect ratio, to fit in the given box."""
+    scale = min(1, max_width / width if width else 1, max_height / height if height else 1)
+    return width * scale, height * scale
+
+def prepare_image(blob, width, height):
+    """
+    Decode an image and downscale it to IMAGE_DPI at the largest size it is drawn.
+    Runs in a worker thread (Pillow releases the GIL while decoding and resampling).
+    Returns a reportlab ImageReader, or None for pictures Pillow cannot read
+    (e.g. WMF, damaged or oversized data), so that only that picture is dropped.
+    """
+    from PIL import Image
+    from reportlab.lib.utils import ImageReader
+
+    try:
+        image = Image.open(io.BytesIO(blob))
+        image_format = image.format
+        size = (max(1, round(width / 72 * IMAGE_DPI)), max(1, round(height / 72 * IMAGE_DPI)))
+        if image.width <= size[0] and image.height <= size[1]:
+            reader = ImageReader(io.BytesIO(blob))  # Small enough: embed as it is
+        elif image_format == 'JPEG':
+            image.draft('RGB', size)  # Decode straight at a reduced scale
+            if image.mode not in ('RGB', 'L'):
+                image = image.convert('RGB')  # e.g. CMYK
+            image.thumbnail(size, Image.LANCZOS)
+            buffer = io.BytesIO()
+            image.save(buffer, 'JPEG', quality=JPEG_QUALITY)
+            reader = ImageReader(buffer)  # JPEG data is embedded as is, no Flate pass
+        else:
+            if image.mode not in ('RGB', 'RGBA', 'L'):
+                # Palette, 16-bit, CMYK, ... images: resample in a mode LANCZOS supports
+                alpha = 'A' in image.getbands() or 'transparency' in image.info
+                image = image.convert('RGBA' if alpha else 'RGB')
+            image.thumbnail(size, Image.LANCZOS)
+            reader = ImageReader(image)
+        reader.getRGBData()  # Decode now, in this thread, not during the layout pass
+        return reader
+    except (OSError, ValueError, Image.DecompressionBombError):
+        return None
+
+
+def start_image_decoding(doc, pool, max_width, max_height):
+    """
+    Queue every distinct picture of the body paragraphs in the thread pool
+    (pictures inside table cells are not drawn, so not decoded either).
+    Identical pictures (same bytes) are decoded once, at the largest size they are drawn.
+    Returns ({relationship id: digest}, {digest: future of the ImageReader}).
+    """
+    digests = {}
+    sizes = {}  # digest -> [blob, largest width, largest height]
+    for paragraph in doc.paragraphs:
+        for r_id, width, height in paragraph_images(paragraph):
+            if r_id not in digests:
+                blob = doc.part.related_parts[r_id].blob
+                digests[r_id] = hashlib.sha1(blob).hexdigest()
+                sizes.setdefault(digests[r_id], [blob, 0, 0])
+            width, height = fit_size(width, height, max_width, max_height)
+            entry = sizes[digests[r_id]]
+            entry[1], entry[2] = max(entry[1], width), max(entry[2], height)
+    futures = {digest: pool.submit(prepare_image, *entry) for digest, entry in sizes.items()}
+    return digests, futures
+
+class PdfLayout:
+    """
+    Lays out text lines, images and tables top to bottom on a reportlab canvas,
+    starting a new page when the next item does not fit.
     """
+
+    def __init__(self, canvas, pagesize, font=FONT):
+        self.canvas = canvas
+        self.font = font
+        self.width, self.height = pagesize
+        self.frame_width = self.width - 2 * MARGIN
+        self.frame_height = self.height - 2 * MARGIN
+        self.y = self.height - MARGIN
+        self.forms = set()  # Images already embedded as Form XObjects
+
+    def make_room(self, needed):
+        if self.y - needed < MARGIN and self.y < self.height - MARGIN:
+            self.canvas.showPage()
+            self.y = self.height - MARGIN
+
+    def text(self, para):
+        """Draw a paragraph, wrapped every LINE_CHARS characters."""
+        while len(para) > LINE_CHARS:
+            self.canvas.drawString(MARGIN, self.y, para[:LINE_CHARS])
+            para = para[LINE_CHARS:]
+            self.y -= LINE_HEIGHT
+            self.make_room(0)
+        self.canvas.drawString(MARGIN, self.y, para)
+        self.y -= LINE_HEIGHT
+        self.make_room(0)
+
+    def embed(self, digest, reader):
+        """Embed an image once, as a unit-square Form XObject that image() scales into place."""
+        if reader is None:
+            return  # Unreadable image: left out
+        self.canvas.beginForm(digest, 0, 0, 1, 1)
+        self.canvas.drawImage(reader, 0, 0, 1, 1, mask='auto')
+        self.canvas.endForm()
+        self.forms.add(digest)
+
+    def image(self, digest, width, height):
+        """Draw an embedded image; every occurrence reuses the same XObject, even at another size."""
+        if digest not in self.forms:
+            return
+        width, height = fit_size(width, height, self.frame_width, self.frame_height)
+        self.make_room(height)
+        self.y -= height
+        self.canvas.saveState()
+        self.canvas.translate(MARGIN, self.y)
+        self.canvas.scale(width, height)
+        self.canvas.doForm(digest)
+        self.canvas.restoreState()
+        self.y -= LINE_HEIGHT
+        self.make_room(0)
+
+    def table(self, table):
+        """
+        Draw a table as a grid, the cell text wrapped to the column width.
+        A row taller than the space left moves to the next page; one taller than
+        a whole page is split across pages. Pictures inside cells are not drawn.
+        """
+        from reportlab.lib.utils import simpleSplit
+
+        page_lines = int(self.frame_height // LINE_HEIGHT)
+        seen = set()  # Vertically merged cells repeat in the rows below: drawn once
+        for row in table.rows:
+            cells = []  # [cell, columns spanned]; horizontally merged cells repeat in row.cells
+            for cell in row.cells:
+                if cells and cell._tc is cells[-1][0]._tc:
+                    cells[-1][1] += 1
+                else:
+                    cells.append([cell, 1])
+            column_width = self.frame_width / sum(span for _, span in cells)
+            widths = [column_width * span for _, span in cells]
+            lines = []
+            for (cell, _), width in zip(cells, widths):
+                text = '' if cell._tc in seen else cell.text
+                seen.add(cell._tc)
+                lines.append(simpleSplit(text, *self.font, width - 6) or [''])
+            row_lines = max(len(cell_lines) for cell_lines in lines)
+            self.make_room((row_lines if row_lines <= page_lines else 1) * LINE_HEIGHT)
+            start = 0
+            while True:
+                count = min(row_lines - start, max(1, int((self.y - MARGIN) // LINE_HEIGHT)))
+                self._row_part(widths, lines, start, count)
+                start += count
+                if start == row_lines:
+                    break
+                self.canvas.showPage()
+                self.y = self.height - MARGIN
+            self.make_room(0)
+        self.y -= LINE_HEIGHT / 2
+
+    def _row_part(self, widths, lines, start, count):
+        """Draw lines start to start + count of every cell of a row, boxed, from the current line down."""
+        height = count * LINE_HEIGHT
+        top = self.y + LINE_HEIGHT - 5  # Top of the row, just above the first baseline
+        x = MARGIN
+        for width, cell_lines in zip(widths, lines):
+            self.canvas.rect(x, top - height, width, height)
+            for i, line in enumerate(cell_lines[start:start + count]):
+                self.canvas.drawString(x + 3, self.y - i * LINE_HEIGHT, line)
+            x += width
+        self.y -= height
+
+def pdf_font(font_file=PDF_FONT_FILE):
+    """
+    (name, size) of the font for the PDF text: FONT, or the TrueType font_file
+    when given. reportlab embeds only the glyphs a document uses (a subset),
+    so even a large Unicode font adds little to the file.
+    """
+    if not font_file:
+        return FONT
+    from reportlab.pdfbase import pdfmetrics
+    from reportlab.pdfbase.ttfonts import TTFont
+
+    name = os.path.splitext(os.path.basename(font_file))[0]
+    if name not in pdfmetrics.getRegisteredFontNames():
+        pdfmetrics.registerFont(TTFont(name, font_file))
+    return name, FONT[1]
+
+@contextmanager
+def binary_streams():
+    """
+    Have reportlab write binary PDF streams inside the block: its default ASCII85
+    text encoding makes them a quarter bigger. useA85 is a process-wide setting,
+    so it is restored on exit for any other reportlab user of the process.
+    """
+    from reportlab import rl_config
+
+    use_a85 = rl_config.useA85
+    rl_config.useA85 = 0
     try:
-        if input_path.endswith('.doc'):
-            temp_txt = docx2txt.process(input_path)
-            paragraphs = temp_txt.split('\n')
+        yield
+    finally:
+        rl_config.useA85 = use_a85
+
+def optimize_pdf(path, compression=PDF_COMPRESSION, linearize=PDF_LINEARIZE):
+    """
+    Rewrite a PDF in place with pikepdf:
+    - pages with identical resource dictionaries share a single one;
+    - streams are decoded (e.g. reportlab's ASCII85) and recompressed at the given zlib level;
+    - small objects are packed into compressed object streams;
+    - with linearize, the file is laid out for "fast web view".
+    Returns {'bytes_before', 'bytes_after', 'seconds'}, or None when pikepdf is
+    not installed and the file is left as it is.
+    """
+    try:
+        import pikepdf
+    except ImportError:
+        return None
+
+    start = time.perf_counter()
+    bytes_before = os.path.getsize(path)
+    temp_path = f"{path}.optimizing"
+    # A process-wide setting with no getter: back to the library default (-1) on exit
+    pikepdf.settings.set_flate_compression_level(compression)
+    try:
+        with pikepdf.open(path) as pdf:
+            shared = {}  # Serialized resources -> indirect dictionary used by every such page
+            for page in pdf.pages:
+                resources = page.obj.get('/Resources')
+                if resources is None or resources.is_indirect:
+                    continue
+                key = resources.unparse()
+                if key not in shared:
+                    shared[key] = pdf.make_indirect(resources)
+                page.obj.Resources = shared[key]
+            pdf.save(temp_path, compress_streams=True, recompress_flate=True,
+                     stream_decode_level=pikepdf.StreamDecodeLevel.generalized,
+                     object_stream_mode=pikepdf.ObjectStreamMode.generate, linearize=linearize)
+        os.replace(temp_path, path)
+    finally:
+        pikepdf.settings.set_flate_compression_level(-1)
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+    return {'bytes_before': bytes_before, 'bytes_after': os.path.getsize(path),
+            'seconds': round(time.perf_counter() - start, 6)}
+
+def convert_docx_to_pdf(input_path, output_path, optimize=PDF_OPTIMIZE, linearize=PDF_LINEARIZE,
+                        font_file=PDF_FONT_FILE):
+    """
+    Convert DOCX or DOC file to PDF and return output_path; raises on failure
+    (ValueError when the input is not a readable Word document).
+    Reads text, one paragraph per line, and writes to PDF using reportlab.
+    DOCX pictures and tables are carried over: pictures are decoded and downscaled
+    in a thread pool while the layout runs, and each distinct picture is embedded once.
+    Pictures inside table cells are left out (tables are drawn as text grids).
+    Binary Word 97-2003 .doc files are streamed paragraph by paragraph (text only),
+    so they are never held in memory as a whole.
+    With optimize, the written PDF goes through optimize_pdf(); linearize makes it "fast web view".
+    """
+    from docx import Document
+    from docx.opc.exceptions import PackageNotFoundError
+    from docx.table import Table
+    from reportlab.pdfgen import canvas as pdf_canvas
+    from reportlab.lib.pagesizes import A4
+
+    # The PDF is written to a temporary file, moved into place before the metrics are taken
+    with ConversionMetrics('docx_doc_to_pdf', input_path, output_path) as metrics, \
+            atomic_output(output_path) as temp_file, binary_streams():
+        # Some ".doc" files are really DOCX zips saved with the old extension
+        streamed = input_path.lower().endswith('.doc') and not zipfile.is_zipfile(input_path)
+        font = pdf_font(font_file)
+        c = pdf_canvas.Canvas(temp_file, pagesize=A4, pageCompression=1,
+                              initialFontName=font[0], initialFontSize=font[1])
+        layout = PdfLayout(c, A4, font)
+        count = 0
+        if streamed:
+            # Read lazily: the paragraphs are parsed while the write stage draws them
+            with metrics.stage('write'):
+                for para in iter_doc_paragraphs(input_path):
+                    count += 1
+                    layout.text(para)
+                c.save()
         else:
-            doc = Document(input_path)
-            paragraphs = [para.text for para in doc.paragraphs]
-
-        c = pdf_canvas.Canvas(output_path, pagesize=A4)
-        width, height = A4
-        y = height - 40
-        for para in paragraphs:
-            while len(para) > 120:
-                c.drawString(40, y, para[:120])
-                para = para[120:]
-                y -= 20
-                if y < 40:
-                    c.showPage()
-                    y = height - 40
-            c.drawString(40, y, para)
-            y -= 20
-            if y < 40:
-                c.showPage()
-                y = height - 40
-        c.save()
-        return True, output_path
+            with metrics.stage('read'):
+                try:
+                    doc = Document(input_path)
+                except PackageNotFoundError as e:
+                    raise ValueError(f"Not a readable Word document: {input_path}") from e
+            with ThreadPoolExecutor(max_workers=IMAGE_WORKERS) as pool:
+                with metrics.stage('transform'):
+                    digests, images = start_image_decoding(doc, pool, layout.frame_width, layout.frame_height)
+                with metrics.stage('write'):
+                    for block in doc.iter_inner_content():
+                        count += 1
+                        if isinstance(block, Table):
+                            layout.table(block)
+                            continue
+                        pictures = list(paragraph_images(block))
+                        if block.text or not pictures:  # No blank line above a lone picture
+                            layout.text(block.text)
+                        for r_id, width, height in pictures:
+                            digest = digests[r_id]
+                            if digest in images:
+                                # First occurrence: embed it, then let the decoded pixels go
+                                layout.embed(digest, images.pop(digest).result())
+                            layout.image(digest, width, height)
+                    c.save()
+        metrics.add_rows(count)
+        if optimize or linearize:
+            with metrics.stage('optimize'):
+                report = optimize_pdf(temp_file, linearize=linearize)
+            metrics.note(pdf_optimization=report)
+    return output_path
+
+def docx_doc_to_pdf(input_path, output_path, optimize=PDF_OPTIMIZE, linearize=PDF_LINEARIZE,
+                    font_file=PDF_FONT_FILE):
+    """
+    Convert DOCX or DOC file to PDF with convert_docx_to_pdf().
+    Returns (True, output_path), or (False, error message) for the GUI.
+    """
+    try:
+        return True, convert_docx_to_pdf(input_path, output_path, optimize, linearize, font_file)
     except Exception as e:
         return False, str(e)
 
+def convert_pdf_to_docx(pdf_file, docx_file):
+    """
+    Convert PDF to DOCX, preserving images and text using pdf2docx, and return
+    docx_file; raises on failure (ValueError when the input is not a readable PDF).
+    """
+    from pdf2docx import Converter  # Improved: handles images!
+
+    with ConversionMetrics('pdf_to_docx_with_images', pdf_file, docx_file) as metrics:
+        # Same steps as Converter.convert(), split so each one is timed
+        with metrics.stage('read'):
+            try:
+                cv = Converter(pdf_file)
+            except OSError:
+                raise
+            except RuntimeError as e:  # PyMuPDF's FileDataError
+                raise ValueError(f"Not a readable PDF: {pdf_file}") from e
+        try:
+            settings = cv.default_settings
+            with metrics.stage('transform'):
+                cv.parse(start=0, end=None, **settings)
+            metrics.add_rows(len(cv.pages))
+            with metrics.stage('write'), atomic_output(docx_file) as temp_file:
+                cv.make_docx(temp_file, **settings)
+        finally:
+            cv.close()
+    return docx_file
+
 def pdf_to_docx_with_images(pdf_file, docx_file):
     """
-    Convert PDF to DOCX, preserving images and text using pdf2docx.
+    Convert PDF to DOCX with convert_pdf_to_docx().
+    Returns (True, docx_file), or (False, error message) for the GUI.
     """
     try:
-        cv = Converter(pdf_file)
-        cv.convert(docx_file, start=0, end=None)
-        cv.close()
-        return True, docx_file
+        return True, convert_pdf_to_docx(pdf_file, docx_file)
     except Exception as e:
         return False, str(e)
 
+def export_sheet(insert_path, sheet_name, target_ext='.csv'):
+    """
+    Export a single sheet of a workbook to <workbook>_<sheet><target_ext>.
+    Runs inside a worker process, so only this sheet is parsed here,
+    and logs its own metrics record (with the worker's peak RSS).
+    """
+    import pandas as pd
+    new_path = f"{os.path.splitext(insert_path)[0]}_{sheet_name}{target_ext}"
+    with ConversionMetrics('export_sheet', insert_path, new_path) as metrics:
+        metrics.note(sheet=sheet_name)
+        with metrics.stage('read'):
+            df = pd.read_excel(insert_path, sheet_name=sheet_name, engine='openpyxl')
+        metrics.add_rows(len(df))
+        with metrics.stage('write'):
+            write_table(df, new_path)
+    return new_path
+
+def export_all_sheets(insert_path, target_ext='.csv', max_workers=None):
+    """
+    Export every sheet of a workbook to its own file, one sheet per worker process.
+    Returns the new paths in workbook order.
+    Every sheet logs its own metrics record, and an export of several sheets one more.
+    """
+    import pandas as pd
+    with pd.ExcelFile(insert_path, engine='openpyxl') as workbook:
+        sheet_names = workbook.sheet_names
+    if len(sheet_names) == 1:
+        return [export_sheet(insert_path, sheet_names[0], target_ext)]
+    with ConversionMetrics('export_all_sheets', insert_path) as metrics:
+        max_workers = min(len(sheet_names), max_workers or os.cpu_count() or 1)
+        # "spawn" so the workers do not inherit the Tk interpreter of the GUI
+        context = multiprocessing.get_context('spawn')
+        with metrics.stage('export'), ProcessPoolExecutor(max_workers=max_workers, mp_context=context) as pool:
+            new_paths = list(pool.map(export_sheet, repeat(insert_path), sheet_names, repeat(target_ext)))
+        metrics.note(sheets=len(sheet_names), outputs=new_paths,
+                     output_bytes=sum(os.path.getsize(path) for path in new_paths))
+    return new_paths
+
+def convert_file(insert_path, target_ext=None, linearize=PDF_LINEARIZE, output_path=None, **csv_options):
+    """
+    Convert one file, choosing the conversion from its extension like conversion():
+    tables to target_ext (or AUTO_TARGET), .pdf -> .docx, .docx/.doc -> .pdf.
+    output_path overrides output_path_for().
+    csv_options (dtype, usecols, ...) are the CSV parsing hints of convert_table().
+    Returns the path of the new file; raises the error of the conversion on failure.
+    """
+    default_output = output_path_for(insert_path, target_ext)  # ValueError for unsupported files
+    ext = os.path.splitext(insert_path)[1].lower()
+    if ext in TABLE_FORMATS:
+        return convert_table(insert_path, target_ext, output_path, **csv_options)
+    if ext == '.pdf':
+        return convert_pdf_to_docx(insert_path, output_path or default_output)
+    return convert_docx_to_pdf(insert_path, output_path or default_output, linearize=linearize)
+
 def conversion():
     """
-    Converts between xlsx/csv, pdf->docx (with images!), and docx/doc->pdf.
+    Converts between xlsx/csv/parquet/feather, pdf->docx (with images!), and docx/doc->pdf.
     Shows result or error.
     """
     insert_path = body.get("1.0", 'end-1c').strip()
     link.delete(1.0, END)
     try:
-        if insert_path.endswith('.xlsx'):
-            new_path = insert_path.replace('.xlsx', '.csv')
-            df = pd.read_excel(insert_path, engine='openpyxl')
-            df.to_csv(new_path, index=False)
-            link.insert(INSERT, new_path)
-        elif insert_path.endswith('.csv'):
-            new_path = insert_path.replace('.csv', '.xlsx')
-            df = pd.read_csv(insert_path)
-            df.to_excel(new_path, index=False, engine='openpyxl')
+        if insert_path.lower().endswith('.xlsx') and all_sheets.get():
+            target = target_format.get()
+            new_paths = export_all_sheets(insert_path, AUTO_TARGET['.xlsx'] if target == "Auto" else target)
+            link.insert(INSERT, "; ".join(new_paths))
+        elif insert_path.lower().endswith(TABLE_FORMATS):
+            target = target_format.get()
+            new_path = convert_table(insert_path, None if target == "Auto" else target)
             link.insert(INSERT, new_path)
         elif insert_path.endswith('.pdf'):
-            new_path = insert_path.replace('.pdf', '.docx')
+            new_path = output_path_for(insert_path)
             success, msg = pdf_to_docx_with_images(insert_path, new_path)
             if success:
                 link.insert(INSERT, new_path)
             else:
                 link.insert(INSERT, f"[ERROR: {msg}]")
         elif insert_path.endswith('.docx') or insert_path.endswith('.doc'):
-            new_path = (insert_path.rsplit('.', 1)[0]) + '.pdf'
-            success, msg = docx_doc_to_pdf(insert_path, new_path)
+            new_path = output_path_for(insert_path)
+            success, msg = docx_doc_to_pdf(insert_path, new_path, linearize=fast_web_view.get())
             if success:
                 link.insert(INSERT, new_path)
             else:
                 link.insert(INSERT, f"[ERROR: {msg}]")
         else:
-            link.insert(INSERT, "[ERROR: Please select a .csv, .xlsx, .pdf, .docx, or .doc file]")
+            link.insert(INSERT, "[ERROR: Please select a .csv, .xlsx, .parquet, .feather, .pdf, .docx, or .doc file]")
     except Exception as e:
         link.insert(INSERT, f"[ERROR: {e}]")
 
-button_style = {'bg': REDDISH, 'fg': WHITE, 'font': DEFAULT_FONT_STYLE, 'width': 12}
 
-open_btn = Button(btn_frame, text="Open File", command=search_for_file_path, **button_style)
-open_btn.pack(side="left", padx=12)
-convert_btn = Button(btn_frame, text="Convert", command=conversion, **button_style)
-convert_btn.pack(side="left", padx=12)
-clear_btn = Button(btn_frame, text="Clear", command=clearFile, **button_style)
-clear_btn.pack(side="left", padx=12)
+if __name__ == "__main__":
+    # ----------------------------- Main Window Setup --------------------------
+    root = tk.Tk()
+    root.geometry("760x320")
+    root.title("Converter_FM")
+    root.config(bg=PURPLE)
+    root.columnconfigure(0, weight=1)
+    for r in range(5):
+        root.rowconfigure(r, weight=1)
+
+    container = tk.Frame(root, bg=PURPLE)
+    container.grid(column=0, row=0, rowspan=5, padx=0, pady=10, sticky="nsew")
+
+    for i in range(7):
+        container.rowconfigure(i, weight=1)
+    container.columnconfigure(0, weight=1)
+    container.columnconfigure(1, weight=1)
+
+    title = Label(container, text="File Converter", font=("Arial", 28, "bold"),
+                  bg=PURPLE, fg=WHITE)
+    title.grid(row=0, column=0, columnspan=2, pady=(10,5), sticky="n")
+
+    body_label = Label(container, text="Input File:", font=ENTRY_FONT_STYLE, bg=PURPLE, fg=WHITE, anchor="e")
+    body_label.grid(row=1, column=0, sticky="e", padx=(40, 8), pady=4)
+
+    body = Text(container, font=ENTRY_FONT_STYLE, height=1, width=45)
+    body.grid(row=1, column=1, sticky="w", padx=(0, 40), pady=4)
+
+    link_label = Label(container, text="Output Path:", font=ENTRY_FONT_STYLE, bg=PURPLE, fg=WHITE, anchor="e")
+    link_label.grid(row=2, column=0, sticky="e", padx=(40, 8), pady=4)
+
+    link = Text(container, font=ENTRY_FONT_STYLE, height=1, width=45)
+    link.grid(row=2, column=1, sticky="w", padx=(0, 40), pady=4)
+
+    # Target format for tables ("Auto" keeps the original xlsx <-> csv behaviour) and output options
+    format_label = Label(container, text="Options:", font=ENTRY_FONT_STYLE, bg=PURPLE, fg=WHITE, anchor="e")
+    format_label.grid(row=3, column=0, sticky="e", padx=(40, 8), pady=4)
+
+    format_frame = tk.Frame(container, bg=PURPLE)
+    format_frame.grid(row=3, column=1, sticky="w", padx=(0, 40), pady=4)
+
+    target_format = StringVar(root, value="Auto")
+    format_menu = OptionMenu(format_frame, target_format, "Auto", *TABLE_FORMATS)
+    format_menu.config(bg=REDDISH, fg=WHITE, font=ENTRY_FONT_STYLE, width=10)
+    format_menu.pack(side="left")
+
+    # Export every sheet of an .xlsx workbook to its own file
+    all_sheets = BooleanVar(root, value=False)
+    sheets_check = Checkbutton(format_frame, text="All sheets", variable=all_sheets, font=ENTRY_FONT_STYLE,
+                               bg=PURPLE, fg=WHITE, selectcolor=REDDISH, activebackground=PURPLE)
+    sheets_check.pack(side="left", padx=(12, 0))
+
+    # Linearized PDF output: the first page of a big PDF shows while the rest downloads
+    fast_web_view = BooleanVar(root, value=PDF_LINEARIZE)
+    web_check = Checkbutton(format_frame, text="Fast web view", variable=fast_web_view, font=ENTRY_FONT_STYLE,
+                            bg=PURPLE, fg=WHITE, selectcolor=REDDISH, activebackground=PURPLE)
+    web_check.pack(side="left", padx=(12, 0))
+
+    btn_frame = tk.Frame(container, bg=PURPLE)
+    btn_frame.grid(row=4, column=0, columnspan=2, pady=16)
+
+    button_style = {'bg': REDDISH, 'fg': WHITE, 'font': DEFAULT_FONT_STYLE, 'width': 12}
+
+    open_btn = Button(btn_frame, text="Open File", command=search_for_file_path, **button_style)
+    open_btn.pack(side="left", padx=12)
+    convert_btn = Button(btn_frame, text="Convert", command=conversion, **button_style)
+    convert_btn.pack(side="left", padx=12)
+    clear_btn = Button(btn_frame, text="Clear", command=clearFile, **button_style)
+    clear_btn.pack(side="left", padx=12)
 
+    if WARM_UP_BACKENDS:
+        root.after(WARM_UP_DELAY_MS, start_warm_up)
 
-root.mainloop()
+    root.mainloop()
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+@author: Federico Mollica
+
+Benchmark: parse time and memory of each CSV engine on a wide and a tall file.
+
+Every measurement runs read_csv_fast() of XLSX_CSV_DOC_PDF_Converter_FM.py
+in a fresh process, so the peak RSS of one engine does not leak into the next.
+The RSS before parsing (interpreter + imports) is shown next to the peak;
+both show "n/a" on Windows, where neither /proc nor resource exist.
+
+Run the benchmark:
+$ python benchmarks/bench_csv_engines.py --tall-rows 1000000 --wide-columns 500
+"""
+
+import argparse
+import multiprocessing
+import os
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from generators import write_tall_csv, write_wide_csv
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from XLSX_CSV_DOC_PDF_Converter_FM import read_csv_fast  # noqa: E402
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+# (label, read_csv_fast keyword arguments)
+VARIANTS = [
+    ("c", {"engine": "c", "max_ratio": 0}),
+    ("python", {"engine": "python", "max_ratio": 0}),
+    ("pyarrow", {"engine": "pyarrow", "max_ratio": 0}),
+    ("pyarrow + categories", {"engine": "pyarrow"}),
+]
+
+
+def peak_rss_mb():
+    """Peak resident set size of this process in MB (None when unavailable)."""
+    # On Linux ru_maxrss survives exec and would report the parent's peak, VmHWM does not
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS bytes
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def measure(path, options):
+    """Parse path once; runs inside a fresh worker process."""
+    baseline = peak_rss_mb()
+    start = time.perf_counter()
+    df = read_csv_fast(path, **options)
+    seconds = time.perf_counter() - start
+    peak = peak_rss_mb()
+    return seconds, baseline, peak, df.memory_usage(deep=True).sum() / 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[1])
+    parser.add_argument("--tall-rows", type=int, default=1000000, help="rows of the tall file")
+    parser.add_argument("--wide-rows", type=int, default=5000, help="rows of the wide file")
+    parser.add_argument("--wide-columns", type=int, default=500, help="columns of the wide file")
+    parser.add_argument("--skip-python", action="store_true", help="skip the (slow) python engine")
+    args = parser.parse_args()
+
+    context = multiprocessing.get_context("spawn")
+    with tempfile.TemporaryDirectory() as tmp:
+        files = [
+            (f"tall ({args.tall_rows} x 7)", os.path.join(tmp, "tall.csv")),
+            (f"wide ({args.wide_rows} x {args.wide_columns})", os.path.join(tmp, "wide.csv")),
+        ]
+        write_tall_csv(files[0][1], args.tall_rows)
+        write_wide_csv(files[1][1], args.wide_rows, args.wide_columns)
+
+        print(f"{'file':<24}{'engine':<24}{'parse (s)':>10}{'RSS before (MB)':>17}{'peak RSS (MB)':>15}{'DataFrame (MB)':>16}")
+        for file_label, path in files:
+            for label, options in VARIANTS:
+                if args.skip_python and options["engine"] == "python":
+                    continue
+                with ProcessPoolExecutor(max_workers=1, mp_context=context) as pool:
+                    seconds, before, peak, frame_mb = pool.submit(measure, path, options).result()
+                before_text = "n/a" if before is None else f"{before:.1f}"
+                peak_text = "n/a" if peak is None else f"{peak:.1f}"
+                print(f"{file_label:<24}{label:<24}{seconds:>10.3f}{before_text:>17}{peak_text:>15}{frame_mb:>16.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+@author: Federico Mollica
+
+Benchmark: DOCX -> PDF on an image-heavy report, comparing
+- naive: every picture decoded at full resolution where it appears and embedded as is;
+- pipeline: docx_doc_to_pdf of XLSX_CSV_DOC_PDF_Converter_FM.py (pictures decoded and
+  downscaled in a thread pool, each distinct picture embedded once).
+Both write binary streams and skip the pikepdf optimization (see bench_pdf_output.py),
+so only the image handling differs.
+
+Run the benchmark:
+$ python benchmarks/bench_docx_images.py --images 60 --distinct 6
+"""
+
+import argparse
+import io
+import os
+import sys
+import tempfile
+import time
+
+from docx import Document
+from reportlab.lib.pagesizes import A4
+from reportlab.lib.utils import ImageReader
+from reportlab.pdfgen import canvas as pdf_canvas
+
+from generators import write_image_docx
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from XLSX_CSV_DOC_PDF_Converter_FM import (  # noqa: E402
+    PdfLayout, binary_streams, docx_doc_to_pdf, fit_size, paragraph_images)
+
+
+def naive_docx_to_pdf(input_path, output_path):
+    """Same layout, but every picture is read from its DOCX bytes at full resolution."""
+    doc = Document(input_path)
+    with binary_streams():
+        c = pdf_canvas.Canvas(output_path, pagesize=A4)
+        layout = PdfLayout(c, A4)
+        for paragraph in doc.paragraphs:
+            layout.text(paragraph.text)
+            for r_id, width, height in paragraph_images(paragraph):
+                width, height = fit_size(width, height, layout.frame_width, layout.frame_height)
+                layout.make_room(height)
+                layout.y -= height
+                c.drawImage(ImageReader(io.BytesIO(doc.part.related_parts[r_id].blob)),
+                            40, layout.y, width, height)
+        c.save()
+
+
+def pipeline_docx_to_pdf(input_path, output_path):
+    success, message = docx_doc_to_pdf(input_path, output_path, optimize=False)
+    if not success:
+        raise RuntimeError(message)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[1])
+    parser.add_argument("--images", type=int, default=60, help="pictures in the report")
+    parser.add_argument("--distinct", type=int, default=6, help="different pictures among them")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = write_image_docx(os.path.join(tmp, "photos.docx"), args.images, args.distinct)
+        print(f"input: {args.images} pictures ({args.distinct} distinct), "
+              f"{os.path.getsize(path) / 1e6:.1f} MB DOCX\n")
+        print(f"{'mode':<10}{'time (s)':>10}{'PDF size (MB)':>16}")
+        for mode, convert in (("naive", naive_docx_to_pdf), ("pipeline", pipeline_docx_to_pdf)):
+            output = os.path.join(tmp, f"{mode}.pdf")
+            start = time.perf_counter()
+            convert(path, output)
+            seconds = time.perf_counter() - start
+            print(f"{mode:<10}{seconds:>10.2f}{os.path.getsize(output) / 1e6:>16.2f}")
+
+
+if __name__ == "__main__":
+    main()
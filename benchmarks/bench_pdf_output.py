@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+@author: Federico Mollica
+
+Benchmark: size and time of the PDF output of docx_doc_to_pdf
+(XLSX_CSV_DOC_PDF_Converter_FM.py) as written by reportlab, then after
+optimize_pdf() at several compression levels, with and without
+linearization ("fast web view"). Needs pikepdf.
+
+Run the benchmark:
+$ python benchmarks/bench_pdf_output.py --paragraphs 20000 --images 60
+"""
+
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+from generators import write_docx, write_image_docx
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from XLSX_CSV_DOC_PDF_Converter_FM import docx_doc_to_pdf, optimize_pdf  # noqa: E402
+
+# (label, compression level, linearize)
+MODES = [("level 1", 1, False), ("level 6", 6, False), ("level 9", 9, False), ("level 9, linearized", 9, True)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[1])
+    parser.add_argument("--paragraphs", type=int, default=20000, help="paragraphs of the text report")
+    parser.add_argument("--images", type=int, default=60, help="pictures of the image report")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        inputs = [
+            (f"text, {args.paragraphs} paragraphs", write_docx(os.path.join(tmp, "text.docx"), args.paragraphs)),
+            (f"images, {args.images} pictures", write_image_docx(os.path.join(tmp, "images.docx"), args.images)),
+        ]
+        for name, path in inputs:
+            written = os.path.join(tmp, "written.pdf")
+            start = time.perf_counter()
+            success, message = docx_doc_to_pdf(path, written, optimize=False)
+            if not success:
+                raise RuntimeError(message)
+            write_seconds = time.perf_counter() - start
+            before = os.path.getsize(written)
+
+            print(f"\n{name}")
+            print(f"{'output':<24}{'time (s)':>10}{'size (kB)':>12}{'saved':>8}")
+            print(f"{'as written':<24}{write_seconds:>10.2f}{before / 1e3:>12.0f}{'':>8}")
+            for label, level, linearize in MODES:
+                optimized = os.path.join(tmp, "optimized.pdf")
+                shutil.copyfile(written, optimized)
+                report = optimize_pdf(optimized, level, linearize)
+                if report is None:
+                    sys.exit("pikepdf is not installed")
+                saved = 1 - report["bytes_after"] / before
+                print(f"{label:<24}{report['seconds']:>10.2f}{report['bytes_after'] / 1e3:>12.0f}{saved:>8.0%}")
+
+
+if __name__ == "__main__":
+    main()
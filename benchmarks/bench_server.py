@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+@author: Federico Mollica
+
+Benchmark: per-file cost of converting small DOCX files to PDF
+- cold: one fresh interpreter per file, as when launching the converter each time;
+- warm: one request per file to a running Converter_Server_FM.py server.
+
+Unix only (the server listens on a Unix socket).
+
+Run the benchmark:
+$ python benchmarks/bench_server.py --files 20
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+from generators import write_docx
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_DIR)
+from Converter_Server_FM import job_for, submit  # noqa: E402
+
+COLD_RUN = """
+import sys
+sys.path.insert(0, {repo!r})
+from XLSX_CSV_DOC_PDF_Converter_FM import docx_doc_to_pdf
+success, message = docx_doc_to_pdf(sys.argv[1], sys.argv[2])
+sys.exit(0 if success else message)
+"""
+
+
+def cold(paths):
+    """Per-file wall times with a new interpreter for every file."""
+    timings = []
+    for path in paths:
+        start = time.perf_counter()
+        subprocess.run([sys.executable, "-c", COLD_RUN.format(repo=REPO_DIR), path,
+                        os.path.splitext(path)[0] + ".pdf"], check=True, capture_output=True)
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+def warm(paths, socket_path):
+    """Per-file wall times with one request per file to the running server."""
+    timings = []
+    for path in paths:
+        start = time.perf_counter()
+        replies = list(submit([job_for(path)], socket_path))
+        timings.append(time.perf_counter() - start)
+        if replies[-1]["status"] != "done":
+            raise RuntimeError(replies[-1])
+    return timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[1])
+    parser.add_argument("--files", type=int, default=20, help="number of small DOCX files")
+    parser.add_argument("--paragraphs", type=int, default=20, help="paragraphs per file")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        template = write_docx(os.path.join(tmp, "template.docx"), args.paragraphs)
+        with open(template, "rb") as f:
+            content = f.read()
+        paths = []
+        for i in range(args.files):
+            paths.append(os.path.join(tmp, f"small_{i}.docx"))
+            with open(paths[-1], "wb") as f:
+                f.write(content)
+
+        socket_path = os.path.join(tmp, "bench.sock")
+        server = subprocess.Popen([sys.executable, os.path.join(REPO_DIR, "Converter_Server_FM.py"),
+                                   "--socket", socket_path, "serve", "--workers", "2"],
+                                  stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True)
+        try:
+            server.stdout.readline()  # "listening" line: workers are up and warm
+            warm_timings = warm(paths, socket_path)
+        finally:
+            server.terminate()
+            server.wait()
+        cold_timings = cold(paths)
+
+    print(f"{'mode':<10}{'median per file (ms)':>22}{'total (s)':>12}")
+    for mode, timings in (("cold", cold_timings), ("warm", warm_timings)):
+        print(f"{mode:<10}{statistics.median(timings) * 1000:>22.1f}{sum(timings):>12.2f}")
+
+
+if __name__ == "__main__":
+    main()
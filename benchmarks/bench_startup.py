@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+@author: Federico Mollica
+
+Benchmark: cold start of the GUI scripts.
+
+For every script it reports
+- the import time of the module, measured with `python -X importtime`,
+  with the heaviest imports listed;
+- the time to first paint: wall time from launching a fresh interpreter
+  until the window has been drawn once (mainloop is replaced by a single
+  update() so the process exits right after the first paint).
+
+The time to first paint needs a display (on headless Linux run it under
+xvfb-run) and is reported as "n/a" otherwise.
+
+Run the benchmark:
+$ python benchmarks/bench_startup.py --target-ms 300
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+# Scripts whose window is built under `if __name__ == "__main__":`, so they can be imported
+SCRIPTS = [
+    "XLSX_CSV_DOC_PDF_Converter_FM.py",
+    "XLSX_CSV_Converter_FM.py",
+    "TXT_Character_Word_Counter_FM.py",
+    "Calculator_FM.py",
+]
+
+# Runs the script as __main__ but returns from mainloop() after the first paint
+FIRST_PAINT = """
+import runpy, sys, tkinter
+def first_paint(self, n=0):
+    self.update()
+    print("PAINTED", flush=True)
+    self.destroy()
+tkinter.Misc.mainloop = first_paint
+sys.argv = [sys.argv[1]]
+runpy.run_path(sys.argv[0], run_name="__main__")
+"""
+
+
+def import_time(module, top=5):
+    """Return (total import time in ms, [(ms, module), ...] of the heaviest imports)."""
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import {module}"],
+                            cwd=REPO_DIR, capture_output=True, text=True)
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr.strip().splitlines()[-1])
+    children = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        # Nesting is shown by indentation: " name" at depth 0, "   name" at depth 1, ...
+        depth = (len(name) - len(name.lstrip()) - 1) // 2
+        entry = (int(cumulative) / 1000, name.strip())
+        if depth == 0:
+            # The children collected so far belong to this top-level import
+            total, direct, children = entry[0], children, []
+        elif depth == 1:
+            children.append(entry)
+    # The module itself is the last top-level entry
+    heaviest = sorted(direct, reverse=True)[:top]
+    return total, heaviest
+
+
+def first_paint_time(script):
+    """Wall time in ms from process launch to first paint, None without a display."""
+    start = time.perf_counter()
+    result = subprocess.run([sys.executable, "-c", FIRST_PAINT, os.path.join(REPO_DIR, script)],
+                            cwd=REPO_DIR, capture_output=True, text=True)
+    elapsed = (time.perf_counter() - start) * 1000
+    if "PAINTED" not in result.stdout:
+        return None
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[1])
+    parser.add_argument("--repeat", type=int, default=5, help="launches per script, median is kept")
+    parser.add_argument("--target-ms", type=float, default=300, help="first paint budget in ms")
+    parser.add_argument("--scripts", nargs="+", default=SCRIPTS, help="scripts to measure")
+    args = parser.parse_args()
+
+    print(f"{'script':<36}{'import (ms)':>12}{'first paint (ms)':>18}  status")
+    failed = False
+    details = []
+    for script in args.scripts:
+        module = os.path.splitext(script)[0]
+        total, heaviest = import_time(module)
+        paints = [first_paint_time(script) for _ in range(args.repeat)]
+        if None in paints:
+            paint_text, status = "n/a", "no display"
+        else:
+            paint = statistics.median(paints)
+            paint_text = f"{paint:.0f}"
+            status = "ok" if paint <= args.target_ms else "OVER BUDGET"
+            failed = failed or paint > args.target_ms
+        print(f"{script:<36}{total:>12.1f}{paint_text:>18}  {status}")
+        details.append((script, heaviest))
+
+    print("\nHeaviest direct imports:")
+    for script, heaviest in details:
+        print(f"  {script}: " + ", ".join(f"{name} {ms:.0f} ms" for ms, name in heaviest))
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+@author: Federico Mollica
+
+Benchmark: load time of the same table stored as .csv, .xlsx, .parquet
+and .feather (plain and zero-copy memory mapped).
+
+The .parquet and .feather files are produced by convert_table() of
+XLSX_CSV_DOC_PDF_Converter_FM.py, exactly as the GUI would produce them.
+
+Run the benchmark:
+$ python benchmarks/bench_table_formats.py --rows 200000
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+import pandas as pd
+import pyarrow.parquet as pq
+
+from generators import write_tall_csv, write_xlsx
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from XLSX_CSV_DOC_PDF_Converter_FM import convert_table, load_memory_mapped  # noqa: E402
+
+
+def best_of(func, repeat):
+    """Return the best wall-clock time of func() over repeat runs."""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[1])
+    parser.add_argument("--rows", type=int, default=200000, help="rows in the CSV/Parquet/Feather table")
+    parser.add_argument("--xlsx-rows", type=int, default=50000, help="rows in the (slow to write) XLSX table")
+    parser.add_argument("--repeat", type=int, default=3, help="runs per loader, best time is kept")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        csv_path = os.path.join(tmp, "table.csv")
+        xlsx_path = os.path.join(tmp, "table_xlsx.xlsx")
+        write_tall_csv(csv_path, args.rows)
+        write_xlsx(xlsx_path, args.xlsx_rows)
+
+        start = time.perf_counter()
+        parquet_path = convert_table(csv_path, ".parquet")
+        print(f"csv -> parquet conversion: {time.perf_counter() - start:.3f} s")
+        start = time.perf_counter()
+        feather_path = convert_table(csv_path, ".feather")
+        print(f"csv -> feather conversion: {time.perf_counter() - start:.3f} s")
+
+        loaders = [
+            (f"csv ({args.rows} rows)", lambda: pd.read_csv(csv_path)),
+            (f"xlsx ({args.xlsx_rows} rows)", lambda: pd.read_excel(xlsx_path, engine="openpyxl")),
+            (f"parquet ({args.rows} rows)", lambda: pq.read_table(parquet_path).to_pandas()),
+            (f"feather ({args.rows} rows)", lambda: load_memory_mapped(feather_path).to_pandas()),
+            (f"feather mmap, zero-copy ({args.rows} rows)", lambda: load_memory_mapped(feather_path)),
+        ]
+        print(f"\n{'format':<42}{'load (s)':>10}{'file size (MB)':>16}")
+        for (name, loader), path in zip(loaders, [csv_path, xlsx_path, parquet_path, feather_path, feather_path]):
+            seconds = best_of(loader, args.repeat)
+            print(f"{name:<42}{seconds:>10.4f}{os.path.getsize(path) / 1e6:>16.2f}")
+
+
+if __name__ == "__main__":
+    main()
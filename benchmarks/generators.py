@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+@author: Federico Mollica
+
+Synthetic, reproducible (fixed seed) inputs for the benchmarks:
+- large CSV/XLSX tables (tall and wide)
+- long DOCX and PDF documents, and image-heavy DOCX reports
+- big text files (streamed to disk, so multi-GB sizes are fine)
+- long calculator expressions
+"""
+
+import random
+
+import numpy as np
+import pandas as pd
+
+SEED = 0
+WORDS = ("lorem ipsum dolor sit amet consectetur adipiscing elit sed do eiusmod "
+         "tempor incididunt ut labore et dolore magna aliqua").split()
+PUNCTUATION = [",", ".", ";", "!", "?", ""]
+
+
+def make_table(rows):
+    """Mixed-type DataFrame (ints, floats, low-cardinality strings, booleans)."""
+    rng = np.random.default_rng(SEED)
+    return pd.DataFrame({
+        "id": np.arange(rows),
+        "amount": rng.random(rows) * 1000,
+        "quantity": rng.integers(0, 500, rows),
+        "region": rng.choice(["north", "south", "east", "west"], rows),
+        "status": rng.choice(["open", "closed", "pending"], rows),
+        "customer": [f"customer_{i % 5000}" for i in range(rows)],
+        "paid": rng.random(rows) > 0.5,
+    })
+
+
+def write_tall_csv(path, rows):
+    """Few columns, many rows."""
+    make_table(rows).to_csv(path, index=False)
+    return path
+
+
+def write_wide_csv(path, rows, columns):
+    """Many numeric columns, few rows."""
+    rng = np.random.default_rng(SEED)
+    pd.DataFrame(rng.random((rows, columns)), columns=[f"c{i}" for i in range(columns)]).to_csv(path, index=False)
+    return path
+
+
+def write_xlsx(path, rows, sheets=1):
+    """Workbook with `sheets` identical sheets of `rows` rows each."""
+    df = make_table(rows)
+    with pd.ExcelWriter(path, engine="openpyxl") as writer:
+        for i in range(sheets):
+            df.to_excel(writer, sheet_name=f"Sheet{i + 1}", index=False)
+    return path
+
+
+def sentence(rng, words):
+    """One random sentence of `words` words."""
+    return " ".join(rng.choice(WORDS) for _ in range(words)).capitalize() + "."
+
+
+def write_docx(path, paragraphs):
+    """DOCX with `paragraphs` paragraphs of varying length."""
+    from docx import Document
+
+    rng = random.Random(SEED)
+    doc = Document()
+    for i in range(paragraphs):
+        if i % 50 == 0:
+            doc.add_heading(f"Section {i // 50 + 1}", level=1)
+        doc.add_paragraph(" ".join(sentence(rng, rng.randint(5, 25)) for _ in range(rng.randint(1, 4))))
+    doc.save(path)
+    return path
+
+
+def make_photo(rng, width, height):
+    """Photo-like JPEG bytes: a colour gradient with noise, so it does not compress to nothing."""
+    import io
+
+    from PIL import Image
+
+    x = np.linspace(0, 255, width)[None, :, None]
+    y = np.linspace(0, 255, height)[:, None, None]
+    tint = rng.random(3)[None, None, :]
+    pixels = (x * tint + y * (1 - tint)) / 2 + rng.normal(0, 25, (height, width, 3))
+    buffer = io.BytesIO()
+    Image.fromarray(pixels.clip(0, 255).astype(np.uint8)).save(buffer, "JPEG", quality=90)
+    return buffer.getvalue()
+
+
+def write_image_docx(path, images, distinct=None, pixels=(2400, 1600)):
+    """
+    DOCX report with `images` photos drawn from `distinct` different ones
+    (logos and charts repeated across pages), a short paragraph before each
+    photo and a small table every ten photos.
+    """
+    import io
+
+    from docx import Document
+    from docx.shared import Inches
+
+    rng = random.Random(SEED)
+    np_rng = np.random.default_rng(SEED)
+    distinct = distinct or max(1, images // 10)
+    photos = [make_photo(np_rng, *pixels) for _ in range(distinct)]
+    doc = Document()
+    for i in range(images):
+        doc.add_paragraph(sentence(rng, rng.randint(5, 25)))
+        doc.add_picture(io.BytesIO(photos[i % distinct]), width=Inches(rng.choice((2, 3, 5))))
+        if i % 10 == 9:
+            table = doc.add_table(rows=3, cols=3)
+            for row in table.rows:
+                for cell in row.cells:
+                    cell.text = sentence(rng, rng.randint(1, 8))
+    doc.save(path)
+    return path
+
+
+def write_pdf(path, pages):
+    """Text-only PDF with `pages` full A4 pages."""
+    from reportlab.lib.pagesizes import A4
+    from reportlab.pdfgen import canvas as pdf_canvas
+
+    rng = random.Random(SEED)
+    c = pdf_canvas.Canvas(path, pagesize=A4)
+    width, height = A4
+    for page in range(pages):
+        c.setFont("Helvetica-Bold", 14)
+        c.drawString(40, height - 40, f"Page {page + 1}")
+        c.setFont("Helvetica", 10)
+        y = height - 70
+        while y > 40:
+            c.drawString(40, y, sentence(rng, 16)[:110])
+            y -= 14
+        c.showPage()
+    c.save()
+    return path
+
+
+def write_text(path, size_bytes, block_bytes=1024 * 1024):
+    """Text file of about size_bytes, written block by block to keep memory flat."""
+    rng = random.Random(SEED)
+    # One random block repeated: generating GBs of random words would dominate the run
+    lines = []
+    length = 0
+    while length < block_bytes:
+        line = " ".join(rng.choice(WORDS) + rng.choice(PUNCTUATION) for _ in range(12)) + "\n"
+        lines.append(line)
+        length += len(line)
+    block = "".join(lines)
+    with open(path, "w", encoding="utf-8") as f:
+        written = 0
+        while written < size_bytes:
+            chunk = block[:size_bytes - written]
+            f.write(chunk)
+            written += len(chunk)
+    return path
+
+
+def make_expression(terms):
+    """Flat calculator expression with `terms` operands, as typed in Calculator_FM."""
+    rng = random.Random(SEED)
+    parts = [str(rng.randint(1, 999))]
+    for _ in range(terms - 1):
+        operator = rng.choice("+-*/")
+        parts.append(operator + str(rng.randint(1, 999)))
+    return "".join(parts)
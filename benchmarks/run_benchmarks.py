@@ -0,0 +1,250 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+@author: Federico Mollica
+
+Benchmark suite for the utility scripts of this repository.
+
+Covers the table conversion behind conversion(), docx_doc_to_pdf,
+pdf_to_docx_with_images (XLSX_CSV_DOC_PDF_Converter_FM.py), count_stats
+(TXT_Character_Word_Counter_FM.py) and Calculator.evaluate (Calculator_FM.py)
+on synthetic inputs from generators.py. Results are saved as JSON together
+with the machine info, and two result files can be compared to flag regressions.
+
+Run the suite and save the results:
+$ python benchmarks/run_benchmarks.py --size small --output results.json
+
+Compare two runs (exit code 1 when a case got slower than the threshold):
+$ python benchmarks/run_benchmarks.py --compare baseline.json results.json --threshold 0.10
+"""
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+from importlib import metadata
+
+import generators
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_DIR)
+
+# Input sizes per preset ("large" produces a multi-GB text file)
+SIZES = {
+    "small": {"rows": 20000, "xlsx_rows": 2000, "paragraphs": 1000, "pdf_pages": 3, "images": 40, "text_mb": 10, "terms": 1000},
+    "medium": {"rows": 500000, "xlsx_rows": 50000, "paragraphs": 20000, "pdf_pages": 30, "images": 200, "text_mb": 200, "terms": 2500},
+    "large": {"rows": 5000000, "xlsx_rows": 300000, "paragraphs": 200000, "pdf_pages": 300, "images": 1000, "text_mb": 2048, "terms": 5000},
+}
+PACKAGES = ["pandas", "pyarrow", "openpyxl", "python-docx", "reportlab", "pdf2docx"]
+
+
+# ------------------------------ Machine Info ----------------------------------
+
+def machine_info():
+    """Describe the machine and environment the results were measured on."""
+    info = {
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "processor": platform.processor(),
+        "cpu_count": os.cpu_count(),
+        "python": platform.python_version(),
+        "packages": {},
+        "git_commit": None,
+    }
+    try:
+        info["memory_bytes"] = os.sysconf("SC_PAGE_SIZE") * os.sysconf("SC_PHYS_PAGES")
+    except (ValueError, AttributeError, OSError):  # Not available on Windows
+        info["memory_bytes"] = None
+    for package in PACKAGES:
+        try:
+            info["packages"][package] = metadata.version(package)
+        except metadata.PackageNotFoundError:
+            info["packages"][package] = None
+    try:
+        info["git_commit"] = subprocess.run(["git", "rev-parse", "HEAD"], cwd=REPO_DIR, capture_output=True,
+                                            text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        pass
+    return info
+
+
+# ------------------------------ Benchmark Cases -------------------------------
+# Each case takes (tmp folder, size preset) and returns (callable to time, units processed).
+# Inputs are generated before timing starts.
+
+def case_csv_to_xlsx(tmp, size):
+    from XLSX_CSV_DOC_PDF_Converter_FM import convert_table
+    path = generators.write_tall_csv(os.path.join(tmp, "csv_to_xlsx.csv"), size["xlsx_rows"])
+    return lambda: convert_table(path, ".xlsx"), size["xlsx_rows"]
+
+
+def case_xlsx_to_csv(tmp, size):
+    from XLSX_CSV_DOC_PDF_Converter_FM import convert_table
+    path = generators.write_xlsx(os.path.join(tmp, "xlsx_to_csv.xlsx"), size["xlsx_rows"])
+    return lambda: convert_table(path, ".csv"), size["xlsx_rows"]
+
+
+def case_csv_to_parquet(tmp, size):
+    from XLSX_CSV_DOC_PDF_Converter_FM import convert_table
+    path = generators.write_tall_csv(os.path.join(tmp, "csv_to_parquet.csv"), size["rows"])
+    return lambda: convert_table(path, ".parquet"), size["rows"]
+
+
+def case_docx_to_pdf(tmp, size):
+    from XLSX_CSV_DOC_PDF_Converter_FM import docx_doc_to_pdf
+    path = generators.write_docx(os.path.join(tmp, "report.docx"), size["paragraphs"])
+    return lambda: check(docx_doc_to_pdf(path, os.path.join(tmp, "report.pdf"))), size["paragraphs"]
+
+
+def case_docx_images_to_pdf(tmp, size):
+    from XLSX_CSV_DOC_PDF_Converter_FM import docx_doc_to_pdf
+    path = generators.write_image_docx(os.path.join(tmp, "photos.docx"), size["images"])
+    return lambda: check(docx_doc_to_pdf(path, os.path.join(tmp, "photos.pdf"))), size["images"]
+
+
+def case_pdf_to_docx(tmp, size):
+    from XLSX_CSV_DOC_PDF_Converter_FM import pdf_to_docx_with_images
+    path = generators.write_pdf(os.path.join(tmp, "scan.pdf"), size["pdf_pages"])
+    return lambda: check(pdf_to_docx_with_images(path, os.path.join(tmp, "scan.docx"))), size["pdf_pages"]
+
+
+def case_count_stats(tmp, size):
+    from TXT_Character_Word_Counter_FM import count_stats
+    path = generators.write_text(os.path.join(tmp, "big.txt"), size["text_mb"] * 1024 * 1024)
+
+    def run():
+        # Same steps as load_file(): read the whole file, then count
+        with open(path, "r", encoding="utf-8") as f:
+            count_stats(f.read())
+    return run, size["text_mb"] * 1024 * 1024
+
+
+def case_calculator_evaluate(tmp, size):
+    from Calculator_FM import Calculator
+    expression = generators.make_expression(size["terms"])
+    # A Calculator without its Tk window: evaluate() only needs the two expressions and the label updates
+    calculator = Calculator.__new__(Calculator)
+    calculator.update_label = calculator.update_total_label = lambda: None
+
+    def run():
+        calculator.total_expression, calculator.current_expression = expression, ""
+        calculator.evaluate()
+        if calculator.current_expression == "Error":
+            raise RuntimeError("Calculator.evaluate returned 'Error'")
+    return run, size["terms"]
+
+
+def check(result):
+    """Raise on the (False, message) results of the converter functions."""
+    success, message = result
+    if not success:
+        raise RuntimeError(message)
+
+
+CASES = {
+    "conversion_csv_to_xlsx": case_csv_to_xlsx,
+    "conversion_xlsx_to_csv": case_xlsx_to_csv,
+    "conversion_csv_to_parquet": case_csv_to_parquet,
+    "docx_doc_to_pdf": case_docx_to_pdf,
+    "docx_images_to_pdf": case_docx_images_to_pdf,
+    "pdf_to_docx_with_images": case_pdf_to_docx,
+    "count_stats": case_count_stats,
+    "calculator_evaluate": case_calculator_evaluate,
+}
+
+
+# ------------------------------ Run & Compare ---------------------------------
+
+def run_suite(size_name, repeat, selected):
+    """Run the selected cases and return the results document."""
+    size = SIZES[size_name]
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        for name in selected:
+            print(f"{name:<28}", end="", flush=True)
+            try:
+                func, units = CASES[name](tmp, size)
+                timings = []
+                for _ in range(repeat):
+                    start = time.perf_counter()
+                    func()
+                    timings.append(time.perf_counter() - start)
+            except Exception as e:
+                results[name] = {"error": str(e)}
+                print(f"ERROR: {e}")
+                continue
+            results[name] = {
+                "units": units,
+                "runs": [round(t, 6) for t in timings],
+                "min": round(min(timings), 6),
+                "median": round(statistics.median(timings), 6),
+            }
+            print(f"median {results[name]['median']:.4f} s  (min {results[name]['min']:.4f} s, {units} units)")
+    return {
+        "created": datetime.now().isoformat(timespec="seconds"),
+        "size": size_name,
+        "size_parameters": size,
+        "repeat": repeat,
+        "machine": machine_info(),
+        "results": results,
+    }
+
+
+def compare(baseline_path, current_path, threshold):
+    """Print the median ratio of every case; return True when any case regressed."""
+    with open(baseline_path, encoding="utf-8") as f:
+        baseline = json.load(f)
+    with open(current_path, encoding="utf-8") as f:
+        current = json.load(f)
+    if baseline.get("size") != current.get("size"):
+        print(f"Warning: comparing size '{baseline.get('size')}' with size '{current.get('size')}'")
+    if baseline["machine"].get("platform") != current["machine"].get("platform"):
+        print("Warning: the two runs come from different machines")
+
+    regressed = False
+    print(f"{'case':<28}{'baseline (s)':>14}{'current (s)':>14}{'ratio':>8}  status")
+    for name in sorted(set(baseline["results"]) | set(current["results"])):
+        old = baseline["results"].get(name, {})
+        new = current["results"].get(name, {})
+        if "median" not in old or "median" not in new:
+            print(f"{name:<28}{'-':>14}{'-':>14}{'-':>8}  missing or failed")
+            continue
+        ratio = new["median"] / old["median"] if old["median"] else float("inf")
+        if ratio > 1 + threshold:
+            status, regressed = "REGRESSION", True
+        elif ratio < 1 - threshold:
+            status = "improved"
+        else:
+            status = "ok"
+        print(f"{name:<28}{old['median']:>14.4f}{new['median']:>14.4f}{ratio:>8.2f}  {status}")
+    return regressed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[1])
+    parser.add_argument("--size", choices=SIZES, default="small", help="input size preset")
+    parser.add_argument("--repeat", type=int, default=3, help="timed runs per case")
+    parser.add_argument("--cases", nargs="+", choices=CASES, default=list(CASES), help="cases to run")
+    parser.add_argument("--output", help="JSON file to save the results to")
+    parser.add_argument("--compare", nargs=2, metavar=("BASELINE", "CURRENT"), help="compare two result files")
+    parser.add_argument("--threshold", type=float, default=0.10, help="relative slowdown flagged as regression")
+    args = parser.parse_args()
+
+    if args.compare:
+        sys.exit(1 if compare(*args.compare, args.threshold) else 0)
+
+    document = run_suite(args.size, args.repeat, args.cases)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(document, f, indent=2)
+        print(f"\nResults saved to {args.output}")
+
+
+if __name__ == "__main__":
+    main()